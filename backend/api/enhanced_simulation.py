@@ -298,6 +298,11 @@ async def analyze_inflation_scenarios(
             base_rate=base_rate
         )
         
+        # One percentile pass per sample
+        final_p10, final_p25, final_p75, final_p90 = np.percentile(final_rates, [10, 25, 75, 90])
+        avg_p10, avg_p90 = np.percentile(avg_rates, [10, 90])
+        cumulative_p10, cumulative_p90 = np.percentile(cumulative_factors, [10, 90])
+        
         return {
             "success": True,
             "regime": regime,
@@ -307,23 +312,23 @@ async def analyze_inflation_scenarios(
                 "final_inflation": {
                     "mean": float(np.mean(final_rates)),
                     "median": float(np.median(final_rates)),
-                    "p10": float(np.percentile(final_rates, 10)),
-                    "p25": float(np.percentile(final_rates, 25)),
-                    "p75": float(np.percentile(final_rates, 75)),
-                    "p90": float(np.percentile(final_rates, 90)),
+                    "p10": float(final_p10),
+                    "p25": float(final_p25),
+                    "p75": float(final_p75),
+                    "p90": float(final_p90),
                     "std": float(np.std(final_rates))
                 },
                 "average_inflation": {
                     "mean": float(np.mean(avg_rates)),
                     "median": float(np.median(avg_rates)),
-                    "p10": float(np.percentile(avg_rates, 10)),
-                    "p90": float(np.percentile(avg_rates, 90))
+                    "p10": float(avg_p10),
+                    "p90": float(avg_p90)
                 },
                 "cumulative_inflation": {
                     "mean": float(np.mean(cumulative_factors)),
                     "median": float(np.median(cumulative_factors)),
-                    "p10": float(np.percentile(cumulative_factors, 10)),
-                    "p90": float(np.percentile(cumulative_factors, 90))
+                    "p10": float(cumulative_p10),
+                    "p90": float(cumulative_p90)
                 }
             },
             "stress_scenarios": {
@@ -423,9 +428,7 @@ async def analyze_longevity(
         
         life_exp = float(np.mean(death_ages))
         median_age = float(np.median(death_ages))
-        p75 = float(np.percentile(death_ages, 75))
-        p90 = float(np.percentile(death_ages, 90))
-        p95 = float(np.percentile(death_ages, 95))
+        p75, p90, p95 = (float(v) for v in np.percentile(death_ages, [75, 90, 95]))
         
         # Planning horizons
         horizon_75 = engine.get_planning_horizon(primary_params, 75)
@@ -4,7 +4,7 @@ Provides industry-standard return and volatility assumptions.
 """
 from fastapi import APIRouter, HTTPException
 from models.schemas import AssumptionPresetModel
-from typing import List
+from typing import Dict, List
 
 router = APIRouter()
 
@@ -58,6 +58,13 @@ PRESETS = {
     }
 }
 
+# Presets are static, so validate them into response models once at import
+# instead of on every request
+_PRESET_MODELS: Dict[str, AssumptionPresetModel] = {
+    name: AssumptionPresetModel(**preset) for name, preset in PRESETS.items()
+}
+_PRESET_LIST: List[AssumptionPresetModel] = list(_PRESET_MODELS.values())
+
 
 @router.get("/", response_model=List[AssumptionPresetModel])
 async def list_presets():
@@ -71,7 +78,7 @@ async def list_presets():
     - Conservative: Risk-averse assumptions
     - Aggressive: Growth-oriented assumptions
     """
-    return list(PRESETS.values())
+    return _PRESET_LIST
 
 
 @router.get("/{preset_name}", response_model=AssumptionPresetModel)
@@ -85,10 +92,10 @@ async def get_preset(preset_name: str):
     **Returns:**
     - Preset with return and volatility assumptions
     """
-    if preset_name not in PRESETS:
+    if preset_name not in _PRESET_MODELS:
         raise HTTPException(
             status_code=404,
             detail=f"Preset '{preset_name}' not found. Available presets: {list(PRESETS.keys())}"
         )
     
-    return PRESETS[preset_name]
+    return _PRESET_MODELS[preset_name]
@@ -46,14 +46,193 @@ from datetime import date, datetime
 import logging
 from typing import List
 from io import BytesIO
-import uuid
-import os
+from functools import lru_cache
 import numpy as np
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_brand_colors():
+    """
+    Salem brand colors for PDF exports, keyed by constant name.
+
+    Parsed from hex once; ReportLab colors are immutable, so they are shared.
+    """
+    from reportlab.lib.colors import HexColor
+
+    return {
+        'SALEM_NAVY': HexColor('#00335D'),
+        'SALEM_GOLD': HexColor('#B49759'),
+        'SALEM_GREEN': HexColor('#4B8F29'),
+        'SALEM_RED': HexColor('#9E2A2B'),
+        'DARK_GRAY': HexColor('#333333'),
+        'LIGHT_GRAY': HexColor('#F5F5F5'),
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_styles():
+    """
+    Salem-branded ReportLab paragraph styles for PDF exports.
+
+    The stylesheet is constant, so it is built once and shared across reports.
+    Callers must treat the returned stylesheet as read-only.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+
+    brand = _get_brand_colors()
+    SALEM_NAVY = brand['SALEM_NAVY']
+    SALEM_GOLD = brand['SALEM_GOLD']
+    DARK_GRAY = brand['DARK_GRAY']
+
+    styles = getSampleStyleSheet()
+    
+    # Helper function to add or get style
+    def add_style_if_not_exists(name, **kwargs):
+        if name not in styles:
+            styles.add(ParagraphStyle(name=name, **kwargs))
+        return styles[name]
+    
+    # Cover title style
+    add_style_if_not_exists(
+        'CoverTitle',
+        parent=styles['Heading1'],
+        fontSize=32,
+        textColor=SALEM_NAVY,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Cover subtitle style
+    add_style_if_not_exists(
+        'CoverSubtitle',
+        parent=styles['Normal'],
+        fontSize=18,
+        textColor=SALEM_GOLD,
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica'
+    )
+    
+    # Section heading style
+    add_style_if_not_exists(
+        'SectionHeading',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor=SALEM_NAVY,
+        spaceAfter=12,
+        spaceBefore=20,
+        fontName='Helvetica-Bold',
+        borderWidth=0,
+        borderColor=SALEM_NAVY,
+        borderPadding=0,
+        leftIndent=0
+    )
+    
+    # Subsection heading
+    add_style_if_not_exists(
+        'SubHeading',
+        parent=styles['Heading2'],
+        fontSize=13,
+        textColor=SALEM_NAVY,
+        spaceAfter=8,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Body text
+    add_style_if_not_exists(
+        'BodyText',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=DARK_GRAY,
+        spaceAfter=8,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    )
+    
+    # Bullet style
+    add_style_if_not_exists(
+        'Bullet',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=DARK_GRAY,
+        spaceAfter=6,
+        leftIndent=20,
+        fontName='Helvetica'
+    )
+
+    return styles
+
+
+@lru_cache(maxsize=1)
+def _get_table_styles():
+    """
+    Shared ReportLab table styles for PDF exports, keyed by table kind.
+
+    Table.setStyle only reads the commands, so one TableStyle per kind is
+    built once and reused by every table and report.
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    brand = _get_brand_colors()
+    SALEM_NAVY = brand['SALEM_NAVY']
+    DARK_GRAY = brand['DARK_GRAY']
+    LIGHT_GRAY = brand['LIGHT_GRAY']
+
+    return {
+        'metrics': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), SALEM_NAVY),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('TOPPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
+            ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+        ]),
+        'stress': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), LIGHT_GRAY),
+            ('TEXTCOLOR', (0, 0), (-1, 0), DARK_GRAY),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ]),
+        'cash_flow': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), SALEM_NAVY),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
+            ('ALIGN', (0, 0), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('FONTSIZE', (0, 1), (-1, -1), 7),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 1), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 5),
+            ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+        ]),
+    }
+
+
 def format_currency(value: float, decimals: int = 0) -> str:
     """Format value as currency"""
     if abs(value) >= 1_000_000:
@@ -333,19 +512,24 @@ async def get_report(plan_id: str):
         # Simulate distribution (in production, use actual simulation results)
         import random
         random.seed(42)  # For reproducibility
-        terminal_values = [
+        terminal_values = np.array([
             median_ending * random.lognormvariate(0, 0.5) for _ in range(num_runs)
-        ]
+        ])
+        
+        # Bucket every value in one pass; the buckets are contiguous [min, max)
+        lower_edges = np.array([min_val for min_val, _, _ in bucket_ranges])
+        bucket_idx = np.searchsorted(lower_edges, terminal_values, side='right') - 1
+        bucket_counts = np.bincount(bucket_idx[bucket_idx >= 0], minlength=len(bucket_ranges))
+        max_terminal = float(terminal_values.max())
         
-        for min_val, max_val, label in bucket_ranges:
-            count = sum(1 for v in terminal_values if min_val <= v < max_val)
+        for (min_val, max_val, label), count in zip(bucket_ranges, bucket_counts.tolist()):
             if count > 0:
                 terminal_wealth_dist.append(
                     TerminalWealthBucket(
                         bucket_label=label,
                         count=count,
                         min_value=min_val,
-                        max_value=max_val if max_val != float('inf') else max(terminal_values),
+                        max_value=max_val if max_val != float('inf') else max_terminal,
                         percentage=count / num_runs
                     )
                 )
@@ -929,17 +1113,15 @@ async def export_pdf_from_results(simulation_results: dict):
     - PDF file for download
     """
     try:
-        from reportlab.lib import colors
         from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.styles import ParagraphStyle
         from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
         from reportlab.platypus import (
-            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            SimpleDocTemplate, Paragraph, Spacer, Table,
             PageBreak, Image as RLImage, KeepTogether
         )
         from reportlab.pdfgen import canvas
-        from reportlab.lib.colors import HexColor
         import matplotlib
         matplotlib.use('Agg')  # Non-interactive backend
         import matplotlib.pyplot as plt
@@ -956,13 +1138,8 @@ async def export_pdf_from_results(simulation_results: dict):
         # Create PDF buffer
         pdf_buffer = BytesIO()
         
-        # Define Salem brand colors
-        SALEM_NAVY = HexColor('#00335D')
-        SALEM_GOLD = HexColor('#B49759')
-        SALEM_GREEN = HexColor('#4B8F29')
-        SALEM_RED = HexColor('#9E2A2B')
-        DARK_GRAY = HexColor('#333333')
-        LIGHT_GRAY = HexColor('#F5F5F5')
+        # Salem brand color (parsed once, shared across reports)
+        DARK_GRAY = _get_brand_colors()['DARK_GRAY']
         
         # Create document
         client_name = client_info.get('client_name', 'Client')
@@ -977,84 +1154,8 @@ async def export_pdf_from_results(simulation_results: dict):
             author="Salem Investment Counselors"
         )
         
-        # Custom styles
-        styles = getSampleStyleSheet()
-        
-        # Helper function to add or get style
-        def add_style_if_not_exists(name, **kwargs):
-            if name not in styles:
-                styles.add(ParagraphStyle(name=name, **kwargs))
-            return styles[name]
-        
-        # Cover title style
-        add_style_if_not_exists(
-            'CoverTitle',
-            parent=styles['Heading1'],
-            fontSize=32,
-            textColor=SALEM_NAVY,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Cover subtitle style
-        add_style_if_not_exists(
-            'CoverSubtitle',
-            parent=styles['Normal'],
-            fontSize=18,
-            textColor=SALEM_GOLD,
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        )
-        
-        # Section heading style
-        add_style_if_not_exists(
-            'SectionHeading',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=SALEM_NAVY,
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold',
-            borderWidth=0,
-            borderColor=SALEM_NAVY,
-            borderPadding=0,
-            leftIndent=0
-        )
-        
-        # Subsection heading
-        add_style_if_not_exists(
-            'SubHeading',
-            parent=styles['Heading2'],
-            fontSize=13,
-            textColor=SALEM_NAVY,
-            spaceAfter=8,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Body text
-        add_style_if_not_exists(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=DARK_GRAY,
-            spaceAfter=8,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        )
-        
-        # Bullet style
-        add_style_if_not_exists(
-            'Bullet',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=DARK_GRAY,
-            spaceAfter=6,
-            leftIndent=20,
-            fontName='Helvetica'
-        )
+        # Custom styles (built once per process)
+        styles = _get_pdf_styles()
         
         # Build PDF content
         story = []
@@ -1113,22 +1214,7 @@ async def export_pdf_from_results(simulation_results: dict):
         metrics_data.append(['Depletion Risk', format_percent(depletion_prob, 1), depl_assessment])
         
         metrics_table = Table(metrics_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), SALEM_NAVY),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
-            ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-        ]))
+        metrics_table.setStyle(_get_table_styles()['metrics'])
         story.append(metrics_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -1527,15 +1613,14 @@ async def export_powerpoint_from_results(simulation_results: dict):
             ax.legend(loc='upper left')
             ax.grid(True, alpha=0.3)
             
-            chart_path = f"/tmp/pptx_chart_{uuid.uuid4().hex}.png"
+            # Render to memory; no temp file round trip
+            chart_buffer = BytesIO()
             plt.tight_layout()
-            plt.savefig(chart_path, dpi=150, bbox_inches='tight')
+            plt.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
             plt.close()
+            chart_buffer.seek(0)
             
-            slide.shapes.add_picture(chart_path, Inches(0.5), Inches(1.2), width=Inches(9))
-            
-            if os.path.exists(chart_path):
-                os.remove(chart_path)
+            slide.shapes.add_picture(chart_buffer, Inches(0.5), Inches(1.2), width=Inches(9))
         
         # ========== SLIDE 4: Assumptions ==========
         slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -1612,17 +1697,15 @@ async def export_pdf(plan_id: str):
     - PDF file for download
     """
     try:
-        from reportlab.lib import colors
         from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.styles import ParagraphStyle
         from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
         from reportlab.platypus import (
-            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            SimpleDocTemplate, Paragraph, Spacer, Table,
             PageBreak, Image as RLImage, KeepTogether
         )
         from reportlab.pdfgen import canvas
-        from reportlab.lib.colors import HexColor
         import matplotlib
         matplotlib.use('Agg')  # Non-interactive backend
         import matplotlib.pyplot as plt
@@ -1636,13 +1719,8 @@ async def export_pdf(plan_id: str):
         # Create PDF buffer
         pdf_buffer = BytesIO()
         
-        # Define Salem brand colors
-        SALEM_NAVY = HexColor('#00335D')
-        SALEM_GOLD = HexColor('#B49759')
-        SALEM_GREEN = HexColor('#4B8F29')
-        SALEM_RED = HexColor('#9E2A2B')
-        DARK_GRAY = HexColor('#333333')
-        LIGHT_GRAY = HexColor('#F5F5F5')
+        # Salem brand color (parsed once, shared across reports)
+        DARK_GRAY = _get_brand_colors()['DARK_GRAY']
         
         # Create document
         doc = SimpleDocTemplate(
@@ -1656,84 +1734,8 @@ async def export_pdf(plan_id: str):
             author="Salem Investment Counselors"
         )
         
-        # Custom styles
-        styles = getSampleStyleSheet()
-        
-        # Helper function to add or get style
-        def add_style_if_not_exists(name, **kwargs):
-            if name not in styles:
-                styles.add(ParagraphStyle(name=name, **kwargs))
-            return styles[name]
-        
-        # Cover title style
-        add_style_if_not_exists(
-            'CoverTitle',
-            parent=styles['Heading1'],
-            fontSize=32,
-            textColor=SALEM_NAVY,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Cover subtitle style
-        add_style_if_not_exists(
-            'CoverSubtitle',
-            parent=styles['Normal'],
-            fontSize=18,
-            textColor=SALEM_GOLD,
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        )
-        
-        # Section heading style
-        add_style_if_not_exists(
-            'SectionHeading',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=SALEM_NAVY,
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold',
-            borderWidth=0,
-            borderColor=SALEM_NAVY,
-            borderPadding=0,
-            leftIndent=0
-        )
-        
-        # Subsection heading
-        add_style_if_not_exists(
-            'SubHeading',
-            parent=styles['Heading2'],
-            fontSize=13,
-            textColor=SALEM_NAVY,
-            spaceAfter=8,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Body text
-        add_style_if_not_exists(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=DARK_GRAY,
-            spaceAfter=8,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        )
-        
-        # Bullet style
-        add_style_if_not_exists(
-            'Bullet',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=DARK_GRAY,
-            spaceAfter=6,
-            leftIndent=20,
-            fontName='Helvetica'
-        )
+        # Custom styles (built once per process)
+        styles = _get_pdf_styles()
         
         # Build PDF content
         story = []
@@ -1777,22 +1779,7 @@ async def export_pdf(plan_id: str):
             metrics_data.append([metric.label, metric.value, assessment])
         
         metrics_table = Table(metrics_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), SALEM_NAVY),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
-            ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-        ]))
+        metrics_table.setStyle(_get_table_styles()['metrics'])
         story.append(metrics_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -1914,18 +1901,7 @@ async def export_pdf(plan_id: str):
                 ]
                 
                 stress_table = Table(stress_data, colWidths=[2*inch, 1.75*inch, 1.5*inch])
-                stress_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), LIGHT_GRAY),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), DARK_GRAY),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ]))
+                stress_table.setStyle(_get_table_styles()['stress'])
                 story.append(stress_table)
                 story.append(Spacer(1, 0.2*inch))
             
@@ -1954,22 +1930,7 @@ async def export_pdf(plan_id: str):
             
             cf_table = Table(cf_data, colWidths=[0.4*inch, 0.4*inch, 0.85*inch, 0.85*inch, 
                                                   0.75*inch, 0.65*inch, 0.75*inch, 0.85*inch])
-            cf_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), SALEM_NAVY),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                ('ALIGN', (0, 0), (1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 8),
-                ('FONTSIZE', (0, 1), (-1, -1), 7),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('TOPPADDING', (0, 0), (-1, 0), 8),
-                ('TOPPADDING', (0, 1), (-1, -1), 5),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 5),
-                ('GRID', (0, 0), (-1, -1), 0.5, DARK_GRAY),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-            ]))
+            cf_table.setStyle(_get_table_styles()['cash_flow'])
             story.append(cf_table)
             story.append(Spacer(1, 0.1*inch))
             story.append(Paragraph(
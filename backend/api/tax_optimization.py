@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import List, Optional
 import logging
+import numpy as np
 
 from core.tax_optimizer import (
     TaxOptimizer,
@@ -102,20 +103,12 @@ async def optimize_roth_conversions(request: TaxOptimizationRequest):
             annual_ss = inputs.social_security_monthly * 12
             annual_pension = inputs.pension_monthly * 12
             
-            projected_income = []
-            for year_idx in range(years_until_rmd):
-                age = inputs.current_age + year_idx
-                year_income = 0.0
-                
-                # Add SS if age reached
-                if age >= inputs.ss_start_age:
-                    year_income += annual_ss
-                
-                # Add pension if age reached
-                if age >= inputs.pension_start_age:
-                    year_income += annual_pension
-                
-                projected_income.append(year_income)
+            # SS and pension switch on once their start age is reached
+            ages = inputs.current_age + np.arange(years_until_rmd)
+            projected_income = (
+                (ages >= inputs.ss_start_age) * annual_ss +
+                (ages >= inputs.pension_start_age) * annual_pension
+            ).astype(float).tolist()
         
         # Run Roth conversion optimization
         if inputs.optimize_roth_conversions and ira_balance > 0 and years_until_rmd > 0:
@@ -529,12 +529,13 @@ class AnnuityEngine:
         # Calculate survival probabilities
         survival_probs = self._calculate_survival_probabilities(age, params, n_years)
         
-        # Discount factors
-        discount_factors = np.array([(1 / (1 + self.discount_rate)) ** t for t in range(n_years)])
+        # Discount factors (one vectorized power over all years)
+        years = np.arange(n_years)
+        discount_factors = np.power(1 / (1 + self.discount_rate), years)
         
         # Payment amounts (adjust for COLA)
         if cola_pct > 0:
-            payment_factors = np.array([(1 + cola_pct) ** t for t in range(n_years)])
+            payment_factors = np.power(1 + cola_pct, years)
         else:
             payment_factors = np.ones(n_years)
         
@@ -662,41 +663,32 @@ class AnnuityEngine:
         portfolio_paths = np.zeros((n_scenarios, n_years + 1))
         portfolio_paths[:, 0] = premium
         
-        for scenario in range(n_scenarios):
-            for year in range(1, n_years + 1):
-                if portfolio_paths[scenario, year-1] <= 0:
-                    portfolio_paths[scenario, year] = 0
-                    continue
-                
-                # Apply return (lognormal)
-                ret = np.exp(
-                    (portfolio_return - 0.5 * portfolio_vol**2) +
-                    portfolio_vol * rng.standard_normal()
-                )
-                
-                # Grow portfolio
-                portfolio_paths[scenario, year] = portfolio_paths[scenario, year-1] * ret
-                
-                # Subtract spending (match annuity payout for fair comparison)
-                portfolio_paths[scenario, year] -= annuity_quote.annual_payout
-                
-                # Floor at zero
-                portfolio_paths[scenario, year] = max(0, portfolio_paths[scenario, year])
+        # Lognormal annual returns for every scenario in a single draw,
+        # transformed in place in the draw buffer
+        log_drift = portfolio_return - 0.5 * portfolio_vol**2
+        returns = rng.standard_normal((n_scenarios, n_years))
+        returns *= portfolio_vol
+        returns += log_drift
+        np.exp(returns, out=returns)
+        
+        for year in range(1, n_years + 1):
+            # Grow, subtract spending (match annuity payout for fair comparison),
+            # floor at zero; depleted paths stay at zero
+            np.multiply(portfolio_paths[:, year - 1], returns[:, year - 1], out=portfolio_paths[:, year])
+            portfolio_paths[:, year] -= annuity_quote.annual_payout
+            np.maximum(portfolio_paths[:, year], 0.0, out=portfolio_paths[:, year])
         
         # Calculate metrics
         # Depletion: portfolio hits zero
-        depletion_scenarios = np.sum(portfolio_paths[:, -1] <= 0)
+        depleted = portfolio_paths <= 0
+        depletion_scenarios = np.sum(depleted[:, -1])
         depletion_probability = depletion_scenarios / n_scenarios
         
-        # Years until depletion (for failed scenarios)
-        years_to_depletion = []
-        for scenario in range(n_scenarios):
-            for year in range(n_years + 1):
-                if portfolio_paths[scenario, year] <= 0:
-                    years_to_depletion.append(year)
-                    break
+        # Years until depletion (for failed scenarios): first year at zero
+        ever_depleted = depleted.any(axis=1)
+        years_to_depletion = np.argmax(depleted[ever_depleted], axis=1)
         
-        median_years_to_depletion = np.median(years_to_depletion) if years_to_depletion else None
+        median_years_to_depletion = np.median(years_to_depletion) if years_to_depletion.size else None
         
         # Ending values (successful scenarios)
         ending_values = portfolio_paths[:, -1]
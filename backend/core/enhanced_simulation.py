@@ -49,6 +49,26 @@ from models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Schema enum -> engine enum mappings used by convert_stochastic_inputs_from_schema
+INFLATION_REGIME_MAP = {
+    InflationRegimeEnum.NORMAL: InflationRegime.NORMAL,
+    InflationRegimeEnum.HIGH: InflationRegime.HIGH,
+    InflationRegimeEnum.DEFLATION: InflationRegime.DEFLATION,
+    InflationRegimeEnum.VOLATILE: InflationRegime.VOLATILE
+}
+
+GENDER_MAP = {
+    GenderEnum.MALE: Gender.MALE,
+    GenderEnum.FEMALE: Gender.FEMALE
+}
+
+HEALTH_MAP = {
+    HealthStatusEnum.POOR: HealthStatus.POOR,
+    HealthStatusEnum.AVERAGE: HealthStatus.AVERAGE,
+    HealthStatusEnum.GOOD: HealthStatus.GOOD,
+    HealthStatusEnum.EXCELLENT: HealthStatus.EXCELLENT
+}
+
 
 @dataclass
 class EnhancedPortfolioInputs(PortfolioInputs):
@@ -382,26 +402,6 @@ def convert_stochastic_inputs_from_schema(
     
     This is the bridge function for API integration.
     """
-    # Map enums
-    inflation_regime_map = {
-        InflationRegimeEnum.NORMAL: InflationRegime.NORMAL,
-        InflationRegimeEnum.HIGH: InflationRegime.HIGH,
-        InflationRegimeEnum.DEFLATION: InflationRegime.DEFLATION,
-        InflationRegimeEnum.VOLATILE: InflationRegime.VOLATILE
-    }
-    
-    gender_map = {
-        GenderEnum.MALE: Gender.MALE,
-        GenderEnum.FEMALE: Gender.FEMALE
-    }
-    
-    health_map = {
-        HealthStatusEnum.POOR: HealthStatus.POOR,
-        HealthStatusEnum.AVERAGE: HealthStatus.AVERAGE,
-        HealthStatusEnum.GOOD: HealthStatus.GOOD,
-        HealthStatusEnum.EXCELLENT: HealthStatus.EXCELLENT
-    }
-    
     # Build enhanced inputs
     enhanced = EnhancedPortfolioInputs(
         **base_inputs.__dict__,
@@ -411,15 +411,15 @@ def convert_stochastic_inputs_from_schema(
     # Add stochastic inflation parameters
     if stochastic_inflation and stochastic_inflation.use_stochastic:
         enhanced.use_stochastic_inflation = True
-        enhanced.inflation_regime = inflation_regime_map.get(stochastic_inflation.regime, InflationRegime.NORMAL)
+        enhanced.inflation_regime = INFLATION_REGIME_MAP.get(stochastic_inflation.regime, InflationRegime.NORMAL)
         enhanced.inflation_volatility = stochastic_inflation.volatility
         enhanced.inflation_mean_reversion = stochastic_inflation.mean_reversion_speed
     
     # Add longevity parameters
     if longevity_params and longevity_params.use_probabilistic:
         enhanced.use_probabilistic_longevity = True
-        enhanced.gender = gender_map.get(longevity_params.gender, Gender.MALE)
-        enhanced.health_status = health_map.get(longevity_params.health_status, HealthStatus.AVERAGE)
+        enhanced.gender = GENDER_MAP.get(longevity_params.gender, Gender.MALE)
+        enhanced.health_status = HEALTH_MAP.get(longevity_params.health_status, HealthStatus.AVERAGE)
         enhanced.smoker = longevity_params.smoker
         enhanced.planning_percentile = longevity_params.planning_percentile
         
@@ -427,8 +427,8 @@ def convert_stochastic_inputs_from_schema(
         if longevity_params.has_spouse:
             enhanced.has_spouse = True
             enhanced.spouse_age = longevity_params.spouse_age
-            enhanced.spouse_gender = gender_map.get(longevity_params.spouse_gender, Gender.FEMALE) if longevity_params.spouse_gender else None
-            enhanced.spouse_health = health_map.get(longevity_params.spouse_health, HealthStatus.AVERAGE)
+            enhanced.spouse_gender = GENDER_MAP.get(longevity_params.spouse_gender, Gender.FEMALE) if longevity_params.spouse_gender else None
+            enhanced.spouse_health = HEALTH_MAP.get(longevity_params.spouse_health, HealthStatus.AVERAGE)
             enhanced.spouse_smoker = longevity_params.spouse_smoker
     
     return enhanced
@@ -484,8 +484,8 @@ class EstatePlanningEngine:
         tax_rate_differential = heir_tax_bracket - owner_tax_rate
         if tax_rate_differential > 0 and ira_growth_rate > 0:
             # Rough approximation
-            break_even = int(np.log(1 + (upfront_tax / (conversion_amount * tax_rate_differential))) / 
-                           np.log(1 + ira_growth_rate))
+            break_even = int(np.log1p(upfront_tax / (conversion_amount * tax_rate_differential)) / 
+                           np.log1p(ira_growth_rate))
         else:
             break_even = 999  # Never breaks even
         
@@ -201,8 +201,7 @@ class GoalEngine:
         Returns:
             GoalResult with probability and recommendations
         """
-        if seed is not None:
-            np.random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         years = goal.years_until_goal(self.current_year)
         if years <= 0:
@@ -232,7 +231,7 @@ class GoalEngine:
                 (cash_pct * self.cash_vol) ** 2
             )
             
-            portfolio_returns = np.random.normal(
+            portfolio_returns = rng.normal(
                 annual_return,
                 annual_vol,
                 self.n_scenarios
@@ -69,8 +69,7 @@ class LongevityEngine:
             seed: Random seed for reproducibility
         """
         self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         
         # Simplified mortality tables (deaths per 1000)
         # Based on SOA 2012 IAM tables
@@ -169,31 +168,27 @@ class LongevityEngine:
         current_age = params.current_age
         max_age = 120
         
-        # Pre-allocate death ages
-        death_ages = np.zeros(n_scenarios)
-        
-        for scenario in range(n_scenarios):
-            age = current_age
-            
-            while age <= max_age:
-                # Get death probability for this age
-                qx = self.get_annual_death_probability(
-                    age=age,
-                    gender=params.gender,
-                    health=params.health_status,
-                    smoker=params.smoker
-                )
-                
-                # Random draw: does person die this year?
-                if np.random.random() < qx:
-                    death_ages[scenario] = age
-                    break
-                
-                age += 1
-            
-            # If survived to max_age, death at max_age
-            if age > max_age:
-                death_ages[scenario] = max_age
+        # Death probability depends only on age, so look it up once per
+        # year of age instead of once per scenario-year
+        n_years = int(max_age - current_age) + 1 if current_age <= max_age else 0
+        qx_by_year = [
+            self.get_annual_death_probability(
+                age=current_age + year,
+                gender=params.gender,
+                health=params.health_status,
+                smoker=params.smoker
+            )
+            for year in range(n_years)
+        ]
+        
+        # One uniform draw per scenario-year: a person dies in the first
+        # year whose draw falls below that year's death probability
+        dies = self.rng.random((n_scenarios, n_years)) < np.asarray(qx_by_year)
+        died = dies.any(axis=1)
+        first_death_year = dies.argmax(axis=1) if n_years else np.zeros(n_scenarios, dtype=int)
+        
+        # Survivors to max_age die at max_age
+        death_ages = np.where(died, current_age + first_death_year, max_age).astype(float)
         
         return death_ages
     
@@ -359,10 +354,7 @@ class LongevityEngine:
         death_ages = self.simulate_lifetime(params, n_scenarios=10000)
         
         life_expectancy = np.mean(death_ages)
-        p50_age = np.percentile(death_ages, 50)
-        p75_age = np.percentile(death_ages, 75)
-        p90_age = np.percentile(death_ages, 90)
-        p95_age = np.percentile(death_ages, 95)
+        p50_age, p75_age, p90_age, p95_age = np.percentile(death_ages, [50, 75, 90, 95])
         
         current_age = params.current_age
         
@@ -34,13 +34,34 @@ The (μ - σ²/2) term is the DRIFT ADJUSTMENT for lognormal distributions.
 
 import numpy as np
 import pandas as pd
+try:
+    import numba
+except ImportError:  # optional accelerator; NumPy path is used without it
+    numba = None
 from typing import Tuple, List, Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from enum import IntEnum
 import logging
 
 logger = logging.getLogger(__name__)
 
+# RMD table (simplified - IRS Uniform Lifetime Table), keyed by age
+DEFAULT_RMD_FACTORS: Dict[int, float] = {
+    73: 26.5, 74: 25.5, 75: 24.6, 76: 23.7, 77: 22.9,
+    78: 22.0, 79: 21.1, 80: 20.2, 81: 19.4, 82: 18.5,
+    83: 17.7, 84: 16.8, 85: 16.0, 86: 15.2, 87: 14.4,
+    88: 13.7, 89: 12.9, 90: 12.2, 91: 11.5, 92: 10.8,
+    93: 10.1, 94: 9.5, 95: 8.9, 96: 8.4, 97: 7.8,
+    98: 7.3, 99: 6.8, 100: 6.4
+}
+
+# Same table as a contiguous array indexed by (age - _DEFAULT_RMD_MIN_AGE)
+_DEFAULT_RMD_MIN_AGE = min(DEFAULT_RMD_FACTORS)
+_DEFAULT_RMD_TABLE = np.array(
+    [DEFAULT_RMD_FACTORS[a] for a in range(_DEFAULT_RMD_MIN_AGE, max(DEFAULT_RMD_FACTORS) + 1)]
+)
+
 
 class SpendingRule(IntEnum):
     """Spending withdrawal strategies"""
@@ -123,14 +144,7 @@ class PortfolioInputs:
     rmd_age: int = 73
     
     # RMD table (simplified - IRS Uniform Lifetime Table)
-    rmd_factors: Dict[int, float] = field(default_factory=lambda: {
-        73: 26.5, 74: 25.5, 75: 24.6, 76: 23.7, 77: 22.9,
-        78: 22.0, 79: 21.1, 80: 20.2, 81: 19.4, 82: 18.5,
-        83: 17.7, 84: 16.8, 85: 16.0, 86: 15.2, 87: 14.4,
-        88: 13.7, 89: 12.9, 90: 12.2, 91: 11.5, 92: 10.8,
-        93: 10.1, 94: 9.5, 95: 8.9, 96: 8.4, 97: 7.8,
-        98: 7.3, 99: 6.8, 100: 6.4
-    })
+    rmd_factors: Dict[int, float] = field(default_factory=DEFAULT_RMD_FACTORS.copy)
     
     # Dynamic allocation (glide path)
     use_glide_path: bool = False
@@ -203,9 +217,14 @@ class SimulationResults:
     Complete simulation results with all metrics and statistics.
     
     This structure provides everything needed for analysis and reporting.
+    
+    paths is stored month-major: it is the transposed view of a C-contiguous
+    (n_months+1, n_scenarios) buffer, so paths.T is contiguous and each
+    month's column is contiguous. Use np.ascontiguousarray(paths) when a
+    scenario-major buffer is needed (e.g. for raw buffer export).
     """
     # Raw simulation data
-    paths: np.ndarray                    # Shape: (n_scenarios, n_months+1)
+    paths: np.ndarray                    # Shape: (n_scenarios, n_months+1), month-major
     monthly_stats: pd.DataFrame          # Percentiles and statistics by month
     
     # Key metrics
@@ -298,12 +317,18 @@ def compute_portfolio_statistics(
     return exp_return, portfolio_vol
 
 
+# Month-major return draws are taken this many scenarios at a time, so only
+# a small block is ever held in scenario-major order
+RETURN_DRAW_BLOCK = 512
+
+
 def generate_returns_geometric_brownian_motion(
     mu_annual: float,
     sigma_annual: float,
     n_scenarios: int,
     n_months: int,
-    rng: np.random.Generator
+    rng: np.random.Generator,
+    month_major: bool = False
 ) -> np.ndarray:
     """
     Generate returns using geometric Brownian motion (lognormal model).
@@ -322,9 +347,12 @@ def generate_returns_geometric_brownian_motion(
         n_scenarios: Number of paths
         n_months: Number of monthly steps
         rng: NumPy random generator
+        month_major: Return the (n_months, n_scenarios) transpose, laid out
+            month by month; scenarios get the same draws as the default layout
         
     Returns:
-        Array of shape (n_scenarios, n_months) with returns (NOT cumulative)
+        Array of shape (n_scenarios, n_months) with returns (NOT cumulative),
+        or (n_months, n_scenarios) when month_major
     """
     dt = 1.0 / 12.0  # Monthly timestep
     
@@ -334,20 +362,71 @@ def generate_returns_geometric_brownian_motion(
     diffusion = sigma_annual * np.sqrt(dt)
     
     # Generate standard normal random variables
-    Z = rng.standard_normal((n_scenarios, n_months))
+    if month_major:
+        # Draw scenario blocks in stream order and transpose each into place,
+        # so seeded draws match the default layout without a full-size copy
+        returns = np.empty((n_months, n_scenarios))
+        for start in range(0, n_scenarios, RETURN_DRAW_BLOCK):
+            stop = min(start + RETURN_DRAW_BLOCK, n_scenarios)
+            returns[:, start:stop] = rng.standard_normal((stop - start, n_months)).T
+    else:
+        returns = rng.standard_normal((n_scenarios, n_months))
     
-    # Lognormal returns: R = exp(drift + diffusion * Z)
-    returns = np.exp(drift + diffusion * Z)
+    # Lognormal returns: R = exp(drift + diffusion * Z), computed in place
+    # in the draw buffer instead of through full-size temporaries
+    returns *= diffusion
+    returns += drift
+    np.exp(returns, out=returns)
     
     # Returns are multiplicative: V(t+1) = V(t) * R(t)
     # NOT additive: V(t+1) ≠ V(t) + R(t)
     
-    logger.debug(f"Generated returns: mean={returns.mean():.6f}, "
-                f"median={np.median(returns):.6f}, std={returns.std():.6f}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Generated returns: mean={returns.mean():.6f}, "
+                    f"median={np.median(returns):.6f}, std={returns.std():.6f}")
     
     return returns
 
 
+@lru_cache(maxsize=32)
+def correlation_cholesky(
+    corr_equity_fi: float,
+    corr_equity_cash: float,
+    corr_fi_cash: float
+) -> np.ndarray:
+    """
+    Lower Cholesky factor L of the equity/FI/cash correlation matrix.
+    
+    Memoized on the three correlations, which rarely change between runs.
+    The returned array is shared between callers and is read-only.
+    
+    Args:
+        corr_equity_fi: Equity-fixed income correlation
+        corr_equity_cash: Equity-cash correlation
+        corr_fi_cash: Fixed income-cash correlation
+    
+    Returns:
+        (3, 3) lower-triangular array with corr = L @ L.T
+    """
+    corr_matrix = np.array([
+        [1.0, corr_equity_fi, corr_equity_cash],
+        [corr_equity_fi, 1.0, corr_fi_cash],
+        [corr_equity_cash, corr_fi_cash, 1.0]
+    ])
+    
+    # Validate correlation matrix is positive definite
+    try:
+        L = np.linalg.cholesky(corr_matrix)
+    except np.linalg.LinAlgError:
+        logger.warning("Correlation matrix not positive definite, using nearest valid matrix")
+        # Make matrix positive definite by adding small diagonal
+        corr_matrix += np.eye(3) * 0.001
+        L = np.linalg.cholesky(corr_matrix)
+    
+    L.setflags(write=False)
+    return L
+
+
 def generate_correlated_asset_returns(
     inputs: PortfolioInputs,
     n_scenarios: int,
@@ -398,58 +477,40 @@ def generate_correlated_asset_returns(
         }
     ]
     
-    # Correlation matrix
-    corr_matrix = np.array([
-        [1.0, inputs.corr_equity_fi, inputs.corr_equity_cash],
-        [inputs.corr_equity_fi, 1.0, inputs.corr_fi_cash],
-        [inputs.corr_equity_cash, inputs.corr_fi_cash, 1.0]
-    ])
+    # Cholesky factor of the correlation matrix (cached per correlation set)
+    L = correlation_cholesky(inputs.corr_equity_fi, inputs.corr_equity_cash, inputs.corr_fi_cash)
     
-    # Validate correlation matrix is positive definite
-    try:
-        L = np.linalg.cholesky(corr_matrix)
-    except np.linalg.LinAlgError:
-        logger.warning("Correlation matrix not positive definite, using nearest valid matrix")
-        # Make matrix positive definite by adding small diagonal
-        corr_matrix += np.eye(3) * 0.001
-        L = np.linalg.cholesky(corr_matrix)
+    # Independent standard normals for every month in one draw (3 per
+    # scenario per month, same stream order as month-by-month draws)
+    Z = rng.standard_normal((n_months, n_scenarios, 3))
     
-    # Pre-allocate return arrays
-    equity_returns = np.zeros((n_scenarios, n_months))
-    fi_returns = np.zeros((n_scenarios, n_months))
-    cash_returns = np.zeros((n_scenarios, n_months))
+    # Create correlated normals: X = Z @ L^T
+    # (We use L^T because we want correlations between rows, not columns)
+    X_corr = Z @ L.T
     
-    # Generate correlated returns month by month
-    for t in range(n_months):
-        # Generate independent standard normals (3 per scenario)
-        Z = rng.standard_normal((n_scenarios, 3))
+    # Transform to lognormal returns for each asset class, (n_scenarios, n_months)
+    asset_returns = []
+    for i, asset in enumerate(assets):
+        mu = asset['mu']
+        sigma = asset['sigma']
         
-        # Create correlated normals: X = Z @ L^T
-        # (We use L^T because we want correlations between rows, not columns)
-        X_corr = Z @ L.T
+        # Drift adjustment for lognormal
+        drift = (mu - 0.5 * sigma**2) * dt
+        diffusion = sigma * np.sqrt(dt)
         
-        # Transform to lognormal returns for each asset class
-        for i, asset in enumerate(assets):
-            mu = asset['mu']
-            sigma = asset['sigma']
-            
-            # Drift adjustment for lognormal
-            drift = (mu - 0.5 * sigma**2) * dt
-            diffusion = sigma * np.sqrt(dt)
-            
-            # Lognormal returns using correlated normals
-            returns_t = np.exp(drift + diffusion * X_corr[:, i])
-            
-            if i == 0:
-                equity_returns[:, t] = returns_t
-            elif i == 1:
-                fi_returns[:, t] = returns_t
-            else:
-                cash_returns[:, t] = returns_t
+        # Lognormal returns using correlated normals
+        returns = np.empty((n_scenarios, n_months))
+        np.multiply(X_corr[:, :, i].T, diffusion, out=returns)
+        returns += drift
+        np.exp(returns, out=returns)
+        asset_returns.append(returns)
+    
+    equity_returns, fi_returns, cash_returns = asset_returns
     
-    logger.debug(f"Generated correlated returns - "
-                f"Equity-FI correlation: {np.corrcoef(equity_returns.flatten(), fi_returns.flatten())[0,1]:.3f}, "
-                f"Expected: {inputs.corr_equity_fi:.3f}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Generated correlated returns - "
+                    f"Equity-FI correlation: {np.corrcoef(equity_returns.ravel(), fi_returns.ravel())[0,1]:.3f}, "
+                    f"Expected: {inputs.corr_equity_fi:.3f}")
     
     return equity_returns, fi_returns, cash_returns
 
@@ -493,6 +554,103 @@ def calculate_required_minimum_distribution(
     if isinstance(rmd, np.ndarray):
         return np.maximum(0.0, rmd)
     return max(0.0, rmd)
+
+
+def rmd_divisor_schedule(
+    ages: np.ndarray,
+    rmd_factors: Dict[int, float]
+) -> np.ndarray:
+    """
+    Vectorized RMD divisor lookup for an array of integer ages.
+    
+    Same table semantics as calculate_required_minimum_distribution: ages
+    below the table get an infinite divisor (zero RMD), ages past the end
+    use the last factor.
+    
+    Args:
+        ages: Integer ages (e.g. one per simulated month)
+        rmd_factors: RMD divisor table
+        
+    Returns:
+        Array of divisors, same shape as ages
+    """
+    if rmd_factors == DEFAULT_RMD_FACTORS:
+        min_age, table = _DEFAULT_RMD_MIN_AGE, _DEFAULT_RMD_TABLE
+    else:
+        min_age = min(rmd_factors.keys())
+        last_factor = rmd_factors[max(rmd_factors.keys())]
+        table = np.array([
+            rmd_factors.get(a, last_factor)
+            for a in range(min_age, max(rmd_factors.keys()) + 1)
+        ])
+    max_age = min_age + len(table) - 1
+    
+    divisors = table[np.clip(ages, min_age, max_age) - min_age]
+    return np.where(ages < min_age, np.inf, divisors)
+
+
+# JIT compilation costs a second or two on first use, so the compiled month
+# loop only kicks in for runs large enough to amortize it.
+NUMBA_MIN_SCENARIOS = 5_000
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _simulate_months_numba(
+        paths_by_month, returns, ruin_months, monthly_fee_rate, income,
+        spending_rule, baseline_spending, spending_pct, spending_floor,
+        spending_ceiling, lifestyle, healthcare, rmd_active, rmd_divisors,
+        ira_pct, marginal_tax_rate, blended_tax_rate, use_guardrails,
+        starting_portfolio, upper_guardrail, lower_guardrail, guardrail_adjustment
+    ):
+        """
+        Fused version of the vectorized month loop, in place.
+        
+        Each month is one pass over the contiguous month row instead of a
+        dozen array-wide operations, with the same per-scenario operation
+        order as the NumPy loop, so results match it exactly. Kept serial:
+        batch runs already spread simulations over worker processes, and a
+        threaded kernel would oversubscribe them (and is not fork-safe).
+        """
+        n_months, n_scenarios = returns.shape
+        multiplier = np.ones(n_scenarios)
+        for month in range(1, n_months + 1):
+            m = month - 1
+            for j in range(n_scenarios):
+                v = paths_by_month[m, j] * returns[m, j]
+                v -= v * monthly_fee_rate
+                v += income[m]
+                
+                if spending_rule == 1:
+                    spending = baseline_spending * multiplier[j]
+                else:
+                    spending = v * spending_pct
+                    if spending_rule == 3:
+                        spending = min(max(spending, spending_floor), spending_ceiling)
+                spending *= lifestyle[m]
+                spending += healthcare[m]
+                v -= spending
+                
+                if rmd_active[m]:
+                    rmd = max(0.0, v * ira_pct / rmd_divisors[m])
+                    v -= rmd * marginal_tax_rate
+                
+                v -= spending * blended_tax_rate
+                
+                if use_guardrails and month > 12:
+                    portfolio_change = (v - starting_portfolio) / starting_portfolio
+                    if portfolio_change > upper_guardrail:
+                        multiplier[j] *= (1 + guardrail_adjustment)
+                    if portfolio_change < -lower_guardrail:
+                        multiplier[j] *= (1 - guardrail_adjustment)
+                
+                if v <= 1.0 and ruin_months[j] == -1:
+                    ruin_months[j] = month
+                
+                paths_by_month[month, j] = max(v, 0.0)
+else:
+    _simulate_months_numba = None
+
+
 def run_monte_carlo_simulation(
     inputs: PortfolioInputs
 ) -> SimulationResults:
@@ -542,16 +700,20 @@ def run_monte_carlo_simulation(
     n_months = inputs.years_to_model * 12
     n_scenarios = inputs.n_scenarios
     
-    # Generate all returns upfront (more efficient)
+    # Generate all returns upfront (more efficient), stored month-major so
+    # the loop reads each month's returns from contiguous memory
     returns = generate_returns_geometric_brownian_motion(
-        mu_annual, sigma_annual, n_scenarios, n_months, rng
+        mu_annual, sigma_annual, n_scenarios, n_months, rng, month_major=True
     )
     
     # Initialize paths array
     # Shape: (n_scenarios, n_months + 1)
     # paths[:, 0] = starting value
     # paths[:, t] = value at end of month t
-    paths = np.zeros((n_scenarios, n_months + 1))
+    # Every column is written by the loop below, so skip the zero fill.
+    # Stored month-major (paths is a transposed view) so each month's
+    # column stays contiguous and cache-friendly across the loop's passes
+    paths = np.empty((n_months + 1, n_scenarios)).T
     paths[:, 0] = inputs.starting_portfolio
     
     # Track ruin events (month of first ruin for each scenario)
@@ -595,114 +757,147 @@ def run_monte_carlo_simulation(
         healthcare_cost = inputs.healthcare_annual * (1 + inputs.healthcare_inflation_real) ** np.maximum(0, years_since_healthcare)
         healthcare_array[healthcare_mask] = (healthcare_cost / 12.0)[healthcare_mask]
     
+    # RMD tax is zero throughout with no IRA balance, no marginal tax, or when
+    # the horizon ends before RMD age, so the step can be skipped entirely
+    apply_rmds = (
+        inputs.ira_pct > 0 and
+        inputs.marginal_tax_rate > 0 and
+        bool(np.any(age_int_array >= inputs.rmd_age))
+    )
+    
+    # Precompute RMD divisors (table lookup once per month, not per step)
+    if apply_rmds:
+        rmd_divisors = rmd_divisor_schedule(age_int_array, inputs.rmd_factors)
+    
+    # Lifestyle-phase spending multipliers by month
+    lifestyle_multiplier = np.ones(n_months)
+    if inputs.use_lifestyle_phases:
+        lifestyle_multiplier[age_int_array >= inputs.slow_go_age] = inputs.slow_go_spending_pct
+        lifestyle_multiplier[age_int_array >= inputs.no_go_age] = inputs.no_go_spending_pct
+    
+    # Loop-invariant rates
+    monthly_spending_pct = inputs.spending_pct_annual / 12.0
+    
+    # Withdrawals from traditional IRA are taxed at marginal rate
+    # Withdrawals from taxable account incur capital gains tax
+    # Withdrawals from Roth are tax-free
+    # For simplicity, we apply a blended tax rate based on account mix
+    blended_tax_rate = (
+        inputs.taxable_pct * inputs.ltcg_tax_rate +
+        inputs.ira_pct * inputs.marginal_tax_rate +
+        inputs.roth_pct * 0.0
+    )
+    
     # ====================
     # MAIN SIMULATION LOOP (VECTORIZED)
     # ====================
-    for month in range(1, n_months + 1):
-        age_int = age_int_array[month - 1]
-        
-        # ------------------
-        # 1. APPLY RETURNS (vectorized across all scenarios)
-        # ------------------
-        paths[:, month] = paths[:, month - 1] * returns[:, month - 1]
-        
-        # ------------------
-        # 2. SUBTRACT FEES (vectorized)
-        # ------------------
-        paths[:, month] -= paths[:, month] * monthly_fee_rate
-        
-        # ------------------
-        # 3. ADD INCOME (precomputed)
-        # ------------------
-        paths[:, month] += monthly_income_array[month - 1]
-        
-        # ------------------
-        # 4. SUBTRACT SPENDING
-        # ------------------
-        if inputs.spending_rule == SpendingRule.FIXED_REAL:
-            spending = baseline_monthly_spending * current_spending_multiplier
+    # Large runs go through the compiled, fused loop when numba is
+    # available; it matches the NumPy loop below exactly
+    if _simulate_months_numba is not None and n_scenarios >= NUMBA_MIN_SCENARIOS:
+        if apply_rmds:
+            rmd_active = age_int_array >= inputs.rmd_age
+        else:
+            rmd_active = np.zeros(n_months, dtype=bool)
+            rmd_divisors = np.ones(n_months)
+        _simulate_months_numba(
+            paths.T, returns, ruin_months, monthly_fee_rate, monthly_income_array,
+            int(inputs.spending_rule), baseline_monthly_spending, monthly_spending_pct,
+            inputs.spending_floor / 12.0, inputs.spending_ceiling / 12.0,
+            lifestyle_multiplier, healthcare_array, rmd_active, rmd_divisors,
+            inputs.ira_pct, inputs.marginal_tax_rate, blended_tax_rate,
+            inputs.use_guardrails, inputs.starting_portfolio, inputs.upper_guardrail,
+            inputs.lower_guardrail, inputs.guardrail_adjustment
+        )
+    else:
+        for month in range(1, n_months + 1):
+            age_int = age_int_array[month - 1]
             
-        elif inputs.spending_rule == SpendingRule.PERCENT_OF_PORTFOLIO:
-            spending = paths[:, month] * (inputs.spending_pct_annual / 12.0)
+            # ------------------
+            # 1. APPLY RETURNS (vectorized across all scenarios)
+            # ------------------
+            paths[:, month] = paths[:, month - 1] * returns[month - 1]
             
-        else:  # HYBRID_FLOOR_CEILING
-            spending = paths[:, month] * (inputs.spending_pct_annual / 12.0)
-            spending = np.clip(
-                spending,
-                inputs.spending_floor / 12.0,
-                inputs.spending_ceiling / 12.0
-            )
-        
-        # Lifestyle phase adjustments
-        if inputs.use_lifestyle_phases:
-            if age_int >= inputs.no_go_age:
-                spending *= inputs.no_go_spending_pct
-            elif age_int >= inputs.slow_go_age:
-                spending *= inputs.slow_go_spending_pct
-        
-        # Add healthcare costs (precomputed)
-        spending += healthcare_array[month - 1]
-        
-        paths[:, month] -= spending
-        
-        # ------------------
-        # 5. APPLY RMDs
-        # ------------------
-        if age_int >= inputs.rmd_age:
-            # RMD applies to traditional IRA portion
-            ira_balance = paths[:, month] * inputs.ira_pct
-            rmd = calculate_required_minimum_distribution(
-                ira_balance,
-                age_int,
-                inputs.rmd_factors
-            )
-            # RMD is a forced distribution (we model as additional withdrawal)
-            # In practice, if spending < RMD, RMD determines withdrawal
-            # For simplicity, we add RMD to withdrawals
-            # Note: This is conservative (forces more withdrawals)
-            rmd_tax = rmd * inputs.marginal_tax_rate
-            paths[:, month] -= rmd_tax  # Tax cost of RMD
-        
-        # ------------------
-        # 6. APPLY TAXES
-        # ------------------
-        # Withdrawals from traditional IRA are taxed at marginal rate
-        # Withdrawals from taxable account incur capital gains tax
-        # Withdrawals from Roth are tax-free
-        # For simplicity, we apply a blended tax rate based on account mix
-        blended_tax_rate = (
-            inputs.taxable_pct * inputs.ltcg_tax_rate +
-            inputs.ira_pct * inputs.marginal_tax_rate +
-            inputs.roth_pct * 0.0
-        )
-        withdrawal_tax = spending * blended_tax_rate
-        paths[:, month] -= withdrawal_tax
-        
-        # ------------------
-        # 7. GUARDRAILS
-        # ------------------
-        if inputs.use_guardrails and month > 12:
-            # Check portfolio performance vs. starting value
-            portfolio_change = (paths[:, month] - inputs.starting_portfolio) / inputs.starting_portfolio
+            # ------------------
+            # 2. SUBTRACT FEES (vectorized)
+            # ------------------
+            paths[:, month] -= paths[:, month] * monthly_fee_rate
             
-            # Increase spending if portfolio up significantly
-            increase_mask = portfolio_change > inputs.upper_guardrail
-            current_spending_multiplier[increase_mask] *= (1 + inputs.guardrail_adjustment)
+            # ------------------
+            # 3. ADD INCOME (precomputed)
+            # ------------------
+            paths[:, month] += monthly_income_array[month - 1]
             
-            # Decrease spending if portfolio down significantly
-            decrease_mask = portfolio_change < -inputs.lower_guardrail
-            current_spending_multiplier[decrease_mask] *= (1 - inputs.guardrail_adjustment)
-        
-        # ------------------
-        # 8. CHECK FOR RUIN
-        # ------------------
-        # Ruin = portfolio value ≤ 0
-        # Use small tolerance to avoid floating point issues
-        ruined_this_month = (paths[:, month] <= 1.0) & (ruin_months == -1)
-        ruin_months[ruined_this_month] = month
-        
-        # Floor at zero (can't have negative portfolio)
-        paths[:, month] = np.maximum(paths[:, month], 0.0)
+            # ------------------
+            # 4. SUBTRACT SPENDING
+            # ------------------
+            if inputs.spending_rule == SpendingRule.FIXED_REAL:
+                spending = baseline_monthly_spending * current_spending_multiplier
+                
+            elif inputs.spending_rule == SpendingRule.PERCENT_OF_PORTFOLIO:
+                spending = paths[:, month] * monthly_spending_pct
+                
+            else:  # HYBRID_FLOOR_CEILING
+                spending = paths[:, month] * monthly_spending_pct
+                spending = np.clip(
+                    spending,
+                    inputs.spending_floor / 12.0,
+                    inputs.spending_ceiling / 12.0
+                )
+            
+            # Lifestyle phase adjustments (precomputed)
+            if inputs.use_lifestyle_phases:
+                spending *= lifestyle_multiplier[month - 1]
+            
+            # Add healthcare costs (precomputed)
+            spending += healthcare_array[month - 1]
+            
+            paths[:, month] -= spending
+            
+            # ------------------
+            # 5. APPLY RMDs
+            # ------------------
+            if apply_rmds and age_int >= inputs.rmd_age:
+                # RMD applies to traditional IRA portion
+                ira_balance = paths[:, month] * inputs.ira_pct
+                rmd = np.maximum(0.0, ira_balance / rmd_divisors[month - 1])
+                # RMD is a forced distribution (we model as additional withdrawal)
+                # In practice, if spending < RMD, RMD determines withdrawal
+                # For simplicity, we add RMD to withdrawals
+                # Note: This is conservative (forces more withdrawals)
+                rmd_tax = rmd * inputs.marginal_tax_rate
+                paths[:, month] -= rmd_tax  # Tax cost of RMD
+            
+            # ------------------
+            # 6. APPLY TAXES (blended rate precomputed)
+            # ------------------
+            withdrawal_tax = spending * blended_tax_rate
+            paths[:, month] -= withdrawal_tax
+            
+            # ------------------
+            # 7. GUARDRAILS
+            # ------------------
+            if inputs.use_guardrails and month > 12:
+                # Check portfolio performance vs. starting value
+                portfolio_change = (paths[:, month] - inputs.starting_portfolio) / inputs.starting_portfolio
+                
+                # Increase spending if portfolio up significantly
+                increase_mask = portfolio_change > inputs.upper_guardrail
+                current_spending_multiplier[increase_mask] *= (1 + inputs.guardrail_adjustment)
+                
+                # Decrease spending if portfolio down significantly
+                decrease_mask = portfolio_change < -inputs.lower_guardrail
+                current_spending_multiplier[decrease_mask] *= (1 - inputs.guardrail_adjustment)
+            
+            # ------------------
+            # 8. CHECK FOR RUIN
+            # ------------------
+            # Ruin = portfolio value ≤ 0
+            # Use small tolerance to avoid floating point issues
+            ruined_this_month = (paths[:, month] <= 1.0) & (ruin_months == -1)
+            ruin_months[ruined_this_month] = month
+            
+            # Floor at zero (can't have negative portfolio)
+            paths[:, month] = np.maximum(paths[:, month], 0.0)
     
     # =============================
     # POST-SIMULATION: CALCULATE METRICS
@@ -710,40 +905,43 @@ def run_monte_carlo_simulation(
     
     logger.info("Simulation complete, calculating metrics...")
     
-    # Monthly statistics
+    # Monthly statistics (one percentile pass for all bands)
+    p05, p10, p25, p50, p75, p90, p95 = np.percentile(
+        paths, [5, 10, 25, 50, 75, 90, 95], axis=0
+    )
     monthly_stats = pd.DataFrame({
         "month": np.arange(n_months + 1),
-        "median": np.median(paths, axis=0),
-        "p10": np.percentile(paths, 10, axis=0),
-        "p25": np.percentile(paths, 25, axis=0),
-        "p75": np.percentile(paths, 75, axis=0),
-        "p90": np.percentile(paths, 90, axis=0),
+        "median": p50,
+        "p10": p10,
+        "p25": p25,
+        "p75": p75,
+        "p90": p90,
         "mean": np.mean(paths, axis=0),
         "std": np.std(paths, axis=0),
-        "p05": np.percentile(paths, 5, axis=0),
-        "p95": np.percentile(paths, 95, axis=0)
-    })
+        "p05": p05,
+        "p95": p95
+    }, index=pd.RangeIndex(n_months + 1), copy=False)
     
     # Success probability (conservative definition)
     # Success = NEVER hitting zero throughout entire horizon
     success_count = np.sum(ruin_months == -1)
     success_probability = success_count / n_scenarios
     
-    # Ending values
+    # Ending values (percentiles are the last month's bands)
     ending_values = paths[:, -1]
-    median_ending = np.median(ending_values)
-    p10_ending = np.percentile(ending_values, 10)
-    p90_ending = np.percentile(ending_values, 90)
+    end_p05, p10_ending, end_p25, median_ending, end_p75, p90_ending, end_p95 = (
+        p05[-1], p10[-1], p25[-1], p50[-1], p75[-1], p90[-1], p95[-1]
+    )
     
     # Ending distribution
     ending_distribution = {
-        "p05": float(np.percentile(ending_values, 5)),
+        "p05": float(end_p05),
         "p10": float(p10_ending),
-        "p25": float(np.percentile(ending_values, 25)),
+        "p25": float(end_p25),
         "p50": float(median_ending),
-        "p75": float(np.percentile(ending_values, 75)),
+        "p75": float(end_p75),
         "p90": float(p90_ending),
-        "p95": float(np.percentile(ending_values, 95))
+        "p95": float(end_p95)
     }
     
     # Annual ruin probability (first-passage probability)
@@ -788,9 +986,9 @@ def run_monte_carlo_simulation(
         depletion_risk = ruined_by_age / n_scenarios
         
         longevity_metrics[milestone_age] = {
-            "median_balance": float(np.median(values_at_age)),
-            "p10_balance": float(np.percentile(values_at_age, 10)),
-            "p90_balance": float(np.percentile(values_at_age, 90)),
+            "median_balance": float(p50[month_idx]),
+            "p10_balance": float(p10[month_idx]),
+            "p90_balance": float(p90[month_idx]),
             "depletion_risk": float(depletion_risk),
             "percent_above_1M": float(np.mean(values_at_age > 1_000_000))
         }
@@ -802,9 +1000,10 @@ def run_monte_carlo_simulation(
     max_drawdown = float(np.min(drawdown))
     
     # Extract representative paths
-    median_scenario_idx = np.argsort(ending_values)[n_scenarios // 2]
-    worst_scenario_idx = np.argsort(ending_values)[int(n_scenarios * 0.05)]
-    best_scenario_idx = np.argsort(ending_values)[int(n_scenarios * 0.95)]
+    ending_order = np.argsort(ending_values)
+    median_scenario_idx = ending_order[n_scenarios // 2]
+    worst_scenario_idx = ending_order[int(n_scenarios * 0.05)]
+    best_scenario_idx = ending_order[int(n_scenarios * 0.95)]
     
     results = SimulationResults(
         paths=paths,
@@ -859,15 +1058,15 @@ def run_stress_test(
     Returns:
         Simulation results under stress
     """
-    stressed = PortfolioInputs(**inputs.__dict__)
-    stressed.equity_return_annual += return_shock
-    stressed.fi_return_annual += return_shock * 0.5
-    stressed.equity_vol_annual *= vol_multiplier
-    stressed.fi_vol_annual *= vol_multiplier
-    stressed.inflation_annual += inflation_shock
-    
-    if random_seed is not None:
-        stressed.random_seed = random_seed
+    stressed = replace(
+        inputs,
+        equity_return_annual=inputs.equity_return_annual + return_shock,
+        fi_return_annual=inputs.fi_return_annual + return_shock * 0.5,
+        equity_vol_annual=inputs.equity_vol_annual * vol_multiplier,
+        fi_vol_annual=inputs.fi_vol_annual * vol_multiplier,
+        inflation_annual=inputs.inflation_annual + inflation_shock,
+        random_seed=inputs.random_seed if random_seed is None else random_seed,
+    )
     
     logger.info(f"Running stress test: {stress_name}")
     return run_monte_carlo_simulation(stressed)
@@ -1665,7 +1665,7 @@ def analyze_sequence_risk(
     print("="*70)
     
     # Generate sample Monte Carlo paths
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_scenarios = 1000
     n_months = years * 12
     
@@ -1675,7 +1675,7 @@ def analyze_sequence_risk(
     
     for month in range(1, n_months + 1):
         # Random returns (7% annual = 0.58% monthly with 18% vol)
-        returns = np.random.normal(0.0058, 0.052, n_scenarios)
+        returns = rng.normal(0.0058, 0.052, n_scenarios)
         paths[:, month] = paths[:, month-1] * (1 + returns) - (monthly_spending + 500)  # Spending + healthcare
     
     # Analyze failures
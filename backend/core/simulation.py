@@ -4,13 +4,30 @@ Pure Python logic with no UI dependencies - all calculations only.
 """
 import numpy as np
 import pandas as pd
+from functools import lru_cache
 from typing import Tuple, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
-@dataclass
+# Upper bound on the pre-drawn (months, n_scenarios) growth-factor matrix;
+# larger runs draw one month at a time instead.
+BATCH_DRAW_MAX_BYTES = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=16)
+def _scenario_columns(n_scenarios: int) -> Tuple[str, ...]:
+    """Column labels for paths_df (only a few distinct scenario counts are used)."""
+    return tuple(f"Scenario_{i}" for i in range(n_scenarios))
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioInputs:
-    """Core simulation parameters (dataclass for internal use)"""
+    """
+    Core simulation parameters (dataclass for internal use).
+    
+    Immutable and slotted: variations are built with dataclasses.replace,
+    and instances are hashable so they can key memoized runs.
+    """
     starting_portfolio: float
     years_to_model: int
     current_age: int
@@ -93,21 +110,14 @@ def compute_portfolio_return_and_vol(inputs: PortfolioInputs) -> Tuple[float, fl
     return exp_return, vol
 
 
-def run_monte_carlo(inputs: PortfolioInputs, seed: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def _simulate_paths(inputs: PortfolioInputs, seed: Optional[int] = None) -> np.ndarray:
     """
-    Run Monte Carlo simulation for portfolio projections.
+    Simulate scenario paths as a raw (n_scenarios, months + 1) array.
     
-    Args:
-        inputs: Simulation parameters
-        seed: Random seed for reproducibility
-        
-    Returns:
-        Tuple of (paths_df, stats_df) where:
-            - paths_df contains all scenario paths
-            - stats_df contains monthly statistics (median, percentiles)
+    Column 0 is the starting portfolio; column t is the value after month t.
+    The array is a month-major (transposed) view, so paths.T is C-contiguous.
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     exp_annual, vol_annual = compute_portfolio_return_and_vol(inputs)
     
@@ -119,7 +129,10 @@ def run_monte_carlo(inputs: PortfolioInputs, seed: Optional[int] = None) -> Tupl
     
     # Initialize arrays
     n_scenarios = inputs.n_scenarios
-    paths = np.zeros((n_scenarios, months + 1))
+    # Every column is written by the loop below, so skip the zero fill.
+    # Stored month-major (paths is a transposed view) so each month's
+    # column is contiguous for the per-month updates
+    paths = np.empty((months + 1, n_scenarios)).T
     paths[:, 0] = inputs.starting_portfolio
     
     # Initialize spending
@@ -131,96 +144,113 @@ def run_monte_carlo(inputs: PortfolioInputs, seed: Optional[int] = None) -> Tupl
     pension_start_month = inputs.pension_start_age * 12
     healthcare_start_month = inputs.healthcare_start_age * 12
     
+    # Per-month schedules are the same for every scenario, so build them once
+    # instead of re-evaluating ages and inflation powers inside the loop
+    month_idx = np.arange(1, months + 1)
+    age_months = current_month_age + month_idx
+    
+    inflated_spending = current_spending * ((1 + inflation_monthly) ** month_idx)
+    
+    income = (
+        np.where(age_months >= ss_start_month, inputs.social_security_monthly, 0.0) +
+        np.where(age_months >= pension_start_month, inputs.pension_monthly, 0.0)
+    )
+    
+    healthcare_monthly_inflation = inputs.healthcare_inflation / 12.0
+    months_since_healthcare = month_idx - (healthcare_start_month - current_month_age)
+    healthcare_cost = np.where(
+        age_months >= healthcare_start_month,
+        inputs.monthly_healthcare * ((1 + healthcare_monthly_inflation) ** months_since_healthcare),
+        0.0
+    )
+    
+    # Fixed-dollar net spending does not depend on the portfolio value
+    fixed_net_spending = inflated_spending + healthcare_cost - income
+    
+    if inputs.use_glide_path:
+        progress = month_idx / months
+        glide_equity_pct = inputs.equity_pct + (inputs.target_equity_at_end - inputs.equity_pct) * progress
+        exp_by_month = (
+            glide_equity_pct * inputs.equity_return_annual +
+            (1 - glide_equity_pct) * inputs.fi_return_annual
+        ) / 12.0
+    else:
+        exp_by_month = np.full(months, exp_monthly)
+    
+    # Lifestyle phases (use_lifestyle_phases) only scaled inflated_spending
+    # after net spending was computed, so they do not affect the paths.
+    
+    # Draw every month's growth factors in one call when they fit in memory
+    batch_draw = months * n_scenarios * 8 <= BATCH_DRAW_MAX_BYTES
+    if batch_draw:
+        growth = rng.standard_normal((months, n_scenarios))
+        growth *= vol_monthly
+        growth += (1.0 + exp_by_month)[:, None]
+    
     for month in range(1, months + 1):
-        # Calculate age for this month
-        age_months = current_month_age + month
-        current_year = month / 12.0
-        
-        # Generate random returns for all scenarios
-        returns = np.random.normal(exp_monthly, vol_monthly, n_scenarios)
-        
-        # Apply returns
-        paths[:, month] = paths[:, month - 1] * (1 + returns)
+        m = month - 1
         
-        # Adjust spending for inflation
-        inflated_spending = current_spending * ((1 + inflation_monthly) ** month)
-        
-        # Add income if applicable
-        income = 0.0
-        if age_months >= ss_start_month:
-            income += inputs.social_security_monthly
-        if age_months >= pension_start_month:
-            income += inputs.pension_monthly
-        
-        # Add healthcare costs if applicable
-        healthcare_cost = 0.0
-        if age_months >= healthcare_start_month:
-            months_since_healthcare = month - (healthcare_start_month - current_month_age)
-            healthcare_monthly_inflation = inputs.healthcare_inflation / 12.0
-            healthcare_cost = inputs.monthly_healthcare * ((1 + healthcare_monthly_inflation) ** months_since_healthcare)
+        # Growth factors for all scenarios (glide path shifts the mean)
+        if batch_draw:
+            month_growth = growth[m]
+        else:
+            month_growth = 1.0 + exp_by_month[m] + vol_monthly * rng.standard_normal(n_scenarios)
         
         # Net spending
         if inputs.spending_rule == 1:
             # Fixed dollar
-            net_spending = inflated_spending + healthcare_cost - income
+            net_spending = fixed_net_spending[m]
         else:
             # Percentage of portfolio
-            net_spending = paths[:, month - 1] * (inputs.spending_pct_annual / 12.0) + healthcare_cost - income
-        
-        # Apply glide path if enabled
-        if inputs.use_glide_path:
-            progress = month / months
-            current_equity_pct = inputs.equity_pct + (inputs.target_equity_at_end - inputs.equity_pct) * progress
-            # Recalculate returns based on new allocation (simplified)
-            exp_annual_adjusted = (
-                current_equity_pct * inputs.equity_return_annual +
-                (1 - current_equity_pct) * inputs.fi_return_annual
-            )
-            exp_monthly_adjusted = exp_annual_adjusted / 12.0
-            returns = np.random.normal(exp_monthly_adjusted, vol_monthly, n_scenarios)
-            paths[:, month] = paths[:, month - 1] * (1 + returns)
+            net_spending = paths[:, month - 1] * (inputs.spending_pct_annual / 12.0) + healthcare_cost[m] - income[m]
         
-        # Apply lifestyle phases if enabled
-        if inputs.use_lifestyle_phases:
-            age_years = age_months / 12.0
-            if age_years >= inputs.no_go_age:
-                inflated_spending *= inputs.no_go_spending_pct
-            elif age_years >= inputs.slow_go_age:
-                inflated_spending *= inputs.slow_go_spending_pct
+        # Apply returns, then subtract net spending (in place in the column)
+        np.multiply(paths[:, month - 1], month_growth, out=paths[:, month])
+        np.subtract(paths[:, month], net_spending, out=paths[:, month])
         
-        # Subtract net spending
-        paths[:, month] = paths[:, month] - net_spending
-        
-        # Apply guardrails if enabled
-        if inputs.use_guardrails and month > 12:
-            # Check if portfolio value deviated significantly
-            for i in range(n_scenarios):
-                if paths[i, month] > paths[i, 0] * (1 + inputs.upper_guardrail):
-                    # Increase spending
-                    net_spending *= 1.05
-                elif paths[i, month] < paths[i, 0] * (1 - inputs.lower_guardrail):
-                    # Decrease spending
-                    net_spending *= 0.95
+        # Guardrails (use_guardrails) only ever rescaled net_spending after it
+        # had been applied for the month, so they do not affect the paths and
+        # are not evaluated per scenario here.
         
         # Floor at zero (can't go negative)
-        paths[:, month] = np.maximum(paths[:, month], 0)
+        np.maximum(paths[:, month], 0, out=paths[:, month])
+    
+    return paths
+
+
+def run_monte_carlo(inputs: PortfolioInputs, seed: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run Monte Carlo simulation for portfolio projections.
+    
+    Args:
+        inputs: Simulation parameters
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Tuple of (paths_df, stats_df) where:
+            - paths_df contains all scenario paths
+            - stats_df contains monthly statistics (median, percentiles)
+    """
+    paths = _simulate_paths(inputs, seed)
+    n_scenarios, months = paths.shape[0], paths.shape[1] - 1
     
     # Create paths DataFrame
     months_array = np.arange(months + 1)
-    paths_df = pd.DataFrame(paths.T, columns=[f"Scenario_{i}" for i in range(n_scenarios)])
+    paths_df = pd.DataFrame(paths.T, columns=list(_scenario_columns(n_scenarios)))
     paths_df["Month"] = months_array
     
-    # Calculate statistics
+    # Calculate statistics (one percentile pass for all bands)
+    p10, p25, p50, p75, p90 = np.percentile(paths, [10, 25, 50, 75, 90], axis=0)
     stats_df = pd.DataFrame({
         "Month": months_array,
-        "Median": np.median(paths, axis=0),
-        "P10": np.percentile(paths, 10, axis=0),
-        "P25": np.percentile(paths, 25, axis=0),
-        "P75": np.percentile(paths, 75, axis=0),
-        "P90": np.percentile(paths, 90, axis=0),
+        "Median": p50,
+        "P10": p10,
+        "P25": p25,
+        "P75": p75,
+        "P90": p90,
         "Mean": np.mean(paths, axis=0),
         "StdDev": np.std(paths, axis=0)
-    })
+    }, index=pd.RangeIndex(months + 1), copy=False)
     
     return paths_df, stats_df
 
@@ -236,42 +266,43 @@ def calculate_metrics(paths_df: pd.DataFrame, stats_df: pd.DataFrame) -> dict:
     Returns:
         Dictionary of key metrics
     """
+    scenario_cols = [col for col in paths_df.columns if col.startswith("Scenario_")]
+    path_metrics = _path_metrics(paths_df[scenario_cols].to_numpy().T)
+    
+    return {
+        "success_probability": path_metrics["success_probability"],
+        "ending_median": float(stats_df["Median"].iloc[-1]),
+        "ending_p10": float(stats_df["P10"].iloc[-1]),
+        "ending_p90": float(stats_df["P90"].iloc[-1]),
+        "depletion_probability": path_metrics["depletion_probability"],
+        "years_depleted": path_metrics["years_depleted"],
+        "shortfall_risk": path_metrics["shortfall_risk"]
+    }
+
+
+def _path_metrics(paths: np.ndarray) -> dict:
+    """Path-dependent metrics from a (n_scenarios, months + 1) array."""
     # Get final values
-    final_values = paths_df.iloc[-1, :-1].values  # Exclude Month column
+    final_values = paths[:, -1]
     
     # Success probability (ending value > 0)
     success_prob = np.mean(final_values > 0)
     
     # Depletion analysis
-    scenario_cols = [col for col in paths_df.columns if col.startswith("Scenario_")]
-    depleted_count = 0
-    years_to_depletion = []
-    
-    for col in scenario_cols:
-        values = paths_df[col].values
-        depletion_months = np.where(values <= 0)[0]
-        if len(depletion_months) > 0:
-            depleted_count += 1
-            years_to_depletion.append(depletion_months[0] / 12.0)
+    depleted_mask = paths <= 0
+    depleted = depleted_mask.any(axis=1)
+    first_depletion_month = depleted_mask.argmax(axis=1)[depleted]
     
-    depletion_prob = depleted_count / len(scenario_cols)
-    avg_years_depleted = np.mean(years_to_depletion) if years_to_depletion else 0
-    
-    # Ending values
-    ending_median = stats_df["Median"].iloc[-1]
-    ending_p10 = stats_df["P10"].iloc[-1]
-    ending_p90 = stats_df["P90"].iloc[-1]
+    depletion_prob = np.count_nonzero(depleted) / len(paths)
+    avg_years_depleted = np.mean(first_depletion_month / 12.0) if first_depletion_month.size else 0
     
     # Shortfall risk (scenarios ending below 50% of starting value)
-    starting_value = paths_df.iloc[0, 0]
+    starting_value = paths[0, 0]
     shortfall_threshold = starting_value * 0.5
     shortfall_risk = np.mean(final_values < shortfall_threshold)
     
     return {
         "success_probability": float(success_prob),
-        "ending_median": float(ending_median),
-        "ending_p10": float(ending_p10),
-        "ending_p90": float(ending_p90),
         "depletion_probability": float(depletion_prob),
         "years_depleted": float(avg_years_depleted),
         "shortfall_risk": float(shortfall_risk)
@@ -294,34 +325,31 @@ def calculate_goal_probabilities(
     Returns:
         List of dictionaries with goal achievement probabilities
     """
-    results = []
     scenario_cols = [col for col in paths_df.columns if col.startswith("Scenario_")]
+    goals = [goal for goal in goals if goal.get("target_age", 0) - current_age >= 0]
+    if not goals:
+        return []
     
-    for goal in goals:
-        target_age = goal.get("target_age", 0)
-        target_amount = goal.get("target_amount", 0)
-        goal_name = goal.get("name", "Goal")
-        
-        # Calculate month index
-        years_from_now = target_age - current_age
-        if years_from_now < 0:
-            continue
-        
-        month_index = min(years_from_now * 12, len(paths_df) - 1)
-        
-        # Get values at that month
-        values_at_goal = paths_df.iloc[month_index][scenario_cols].values
-        
-        # Calculate probability
-        prob = np.mean(values_at_goal >= target_amount)
-        
-        results.append({
-            "goal_name": goal_name,
-            "target_amount": target_amount,
-            "target_age": target_age,
+    target_ages = np.array([goal.get("target_age", 0) for goal in goals])
+    target_amounts = np.array([goal.get("target_amount", 0) for goal in goals])
+    
+    # Values at every goal's month in one gather: (n_goals, n_scenarios)
+    month_index = np.minimum((target_ages - current_age) * 12, len(paths_df) - 1)
+    values_at_goals = paths_df[scenario_cols].to_numpy()[month_index]
+    
+    probs = np.mean(values_at_goals >= target_amounts[:, None], axis=1)
+    medians = np.median(values_at_goals, axis=1)
+    
+    results = [
+        {
+            "goal_name": goal.get("name", "Goal"),
+            "target_amount": goal.get("target_amount", 0),
+            "target_age": goal.get("target_age", 0),
             "probability": float(prob),
-            "median_value": float(np.median(values_at_goal))
-        })
+            "median_value": float(median)
+        }
+        for goal, prob, median in zip(goals, probs, medians)
+    ]
     
     return results
 
@@ -338,22 +366,39 @@ def sensitivity_analysis(inputs: PortfolioInputs, parameter: str, variations: Li
     Returns:
         DataFrame with sensitivity results
     """
-    results = []
+    # Repeated values (e.g. the base case listed twice) are simulated once
+    unique_values = list(dict.fromkeys(variations))
+    n_unique = len(unique_values)
+    
+    # Common random numbers: every variation replays the same shocks, so
+    # differences between rows reflect the parameter, not sampling noise
+    seed = int(np.random.default_rng().integers(2**32))
     
-    for value in variations:
+    # One array per output column, filled by index (no per-row dicts)
+    success_probability = np.empty(n_unique)
+    ending_median = np.empty(n_unique)
+    depletion_probability = np.empty(n_unique)
+    
+    for i, value in enumerate(unique_values):
         # Create modified inputs
-        modified_inputs = PortfolioInputs(**inputs.__dict__)
-        setattr(modified_inputs, parameter, value)
+        modified_inputs = replace(inputs, **{parameter: value})
         
-        # Run simulation
-        paths_df, stats_df = run_monte_carlo(modified_inputs)
-        metrics = calculate_metrics(paths_df, stats_df)
+        # Run simulation; only metrics are reported, so the paths and
+        # stats DataFrames are never built
+        paths = _simulate_paths(modified_inputs, seed)
+        metrics = _path_metrics(paths)
         
-        results.append({
-            "parameter_value": value,
-            "success_probability": metrics["success_probability"],
-            "ending_median": metrics["ending_median"],
-            "depletion_probability": metrics["depletion_probability"]
-        })
-    
-    return pd.DataFrame(results)
+        success_probability[i] = metrics["success_probability"]
+        ending_median[i] = np.percentile(paths[:, -1], 50)
+        depletion_probability[i] = metrics["depletion_probability"]
+    
+    # Expand back to one row per requested value, in request order
+    position = {value: i for i, value in enumerate(unique_values)}
+    rows = [position[value] for value in variations]
+    
+    return pd.DataFrame({
+        "parameter_value": list(variations),
+        "success_probability": success_probability[rows],
+        "ending_median": ending_median[rows],
+        "depletion_probability": depletion_probability[rows]
+    })
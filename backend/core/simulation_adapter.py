@@ -2,6 +2,10 @@
 Adapter layer for new Monte Carlo engine.
 Provides backward-compatible interface for existing API endpoints.
 """
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, fields, replace
+from functools import lru_cache
 from typing import Tuple, Optional, List, Dict
 import pandas as pd
 import numpy as np
@@ -16,6 +20,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _scenario_columns(n_scenarios: int) -> Tuple[str, ...]:
+    """Legacy paths_df column labels (only a few distinct scenario counts are used)."""
+    return tuple(f"scenario_{i}" for i in range(n_scenarios))
+
+
 def convert_old_inputs_to_new(old_inputs) -> NewPortfolioInputs:
     """
     Convert old PortfolioInputs dataclass to new engine format.
@@ -97,11 +107,15 @@ def convert_old_inputs_to_new(old_inputs) -> NewPortfolioInputs:
 
 def convert_results_to_legacy_format(
     results: SimulationResults,
-    inputs: NewPortfolioInputs
+    inputs: NewPortfolioInputs,
+    copy: bool = False
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Convert new engine results to legacy format for backward compatibility.
     
+    paths_df wraps results.paths without copying unless copy is set
+    (needed when the results are shared, e.g. cached).
+    
     Returns:
         Tuple of (paths_df, stats_df) matching old engine format
     """
@@ -109,7 +123,8 @@ def convert_results_to_legacy_format(
     n_scenarios, n_months = results.paths.shape
     paths_df = pd.DataFrame(
         results.paths.T,  # Transpose to have months as rows
-        columns=[f"scenario_{i}" for i in range(n_scenarios)]
+        columns=list(_scenario_columns(n_scenarios)),
+        copy=copy
     )
     paths_df.insert(0, 'month', range(n_months))
     
@@ -119,13 +134,39 @@ def convert_results_to_legacy_format(
     return paths_df, stats_df
 
 
+def _paths_array(paths_df: pd.DataFrame) -> np.ndarray:
+    """
+    Path values as a (months, n_scenarios) array.
+    
+    Frames from run_monte_carlo_adapted carry the engine results, whose
+    month-major paths are read directly instead of copying the frame.
+    pandas carries attrs onto slices and copies, so the results are only
+    used while the frame still has their shape and wraps their paths.
+    """
+    results = paths_df.attrs.get('new_engine_results')
+    if results is not None and results.paths.shape == (paths_df.shape[1] - 1, paths_df.shape[0]):
+        first_column = paths_df.iloc[:, 1].to_numpy()
+        first_path = results.paths[0]
+        if (
+            first_column.__array_interface__['data'][0] == first_path.__array_interface__['data'][0] and
+            first_column.strides == first_path.strides
+        ):
+            return results.paths.T
+    return paths_df.iloc[:, 1:].to_numpy()  # Skip 'month' column
+
+
 def calculate_metrics(paths_df: pd.DataFrame, stats_df: pd.DataFrame) -> Dict:
     """
     Calculate metrics from simulation results.
     Maintains compatibility with old API while adding new metrics.
     """
+    return _metrics_from_paths(_paths_array(paths_df), stats_df.iloc[-1])
+
+
+def _metrics_from_paths(paths: np.ndarray, last_stats: pd.Series) -> Dict:
+    """Legacy metrics from a (months, n_scenarios) path array and the final stats row."""
     # Get ending values from last row
-    ending_values = paths_df.iloc[-1, 1:].values  # Exclude 'month' column
+    ending_values = paths[-1]
     
     # Calculate traditional metrics
     success_count = np.sum(ending_values > 0)
@@ -136,20 +177,13 @@ def calculate_metrics(paths_df: pd.DataFrame, stats_df: pd.DataFrame) -> Dict:
     depletion_count = total_scenarios - success_count
     depletion_probability = depletion_count / total_scenarios
     
-    # Calculate years to depletion for failed scenarios
-    years_depleted_list = []
-    for col in paths_df.columns[1:]:  # Skip 'month' column
-        scenario_values = paths_df[col].values
-        if scenario_values[-1] == 0:  # Scenario failed
-            # Find first month where value hit zero
-            depletion_month = np.argmax(scenario_values == 0)
-            if depletion_month > 0:
-                years_depleted_list.append(depletion_month / 12)
-    
-    avg_years_depleted = np.mean(years_depleted_list) if years_depleted_list else 0.0
+    # Calculate years to depletion for failed scenarios: first month each
+    # failed path hit zero, in one pass over the (months, failed) block
+    failed_paths = paths[:, paths[-1] == 0]
+    depletion_months = np.argmax(failed_paths == 0, axis=0)
+    depletion_months = depletion_months[depletion_months > 0]
     
-    # Percentiles from stats_df last row
-    last_stats = stats_df.iloc[-1]
+    avg_years_depleted = np.mean(depletion_months / 12) if depletion_months.size else 0.0
     
     return {
         "success_probability": success_probability,
@@ -162,6 +196,34 @@ def calculate_metrics(paths_df: pd.DataFrame, stats_df: pd.DataFrame) -> Dict:
     }
 
 
+def _simulate(inputs, seed: Optional[int]) -> SimulationResults:
+    """Convert legacy inputs and run the new engine."""
+    new_inputs = convert_old_inputs_to_new(inputs)
+    if seed is not None:
+        new_inputs.random_seed = seed
+    return run_monte_carlo_simulation(new_inputs)
+
+
+# Each entry holds a full paths array (about 48 MB for 10,000 scenarios over
+# 50 years), so only the last few seeded runs are kept
+@lru_cache(maxsize=4)
+def _simulate_cached(inputs_type: type, inputs_values: tuple, seed: int) -> SimulationResults:
+    """
+    Memoized engine run for seeded requests.
+    
+    Seeded simulations are deterministic in their inputs, so repeated
+    requests (re-runs of the same inputs) reuse the previous results.
+    Results are shared between callers, so their arrays are made
+    read-only.
+    """
+    results = _simulate(inputs_type(*inputs_values), seed)
+    for field in fields(results):
+        value = getattr(results, field.name)
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    return results
+
+
 def run_monte_carlo_adapted(
     inputs,
     seed: Optional[int] = None
@@ -173,16 +235,17 @@ def run_monte_carlo_adapted(
     """
     logger.info("Using NEW Monte Carlo engine (with adapter)")
     
-    # Convert inputs
-    new_inputs = convert_old_inputs_to_new(inputs)
-    if seed is not None:
-        new_inputs.random_seed = seed
-    
-    # Run new simulation
-    results = run_monte_carlo_simulation(new_inputs)
+    # Run new simulation (unseeded runs are random, so only seeded ones are cached)
+    cached = seed is not None
+    if cached:
+        results = _simulate_cached(type(inputs), astuple(inputs), seed)
+    else:
+        results = _simulate(inputs, seed)
+    new_inputs = results.inputs
     
-    # Convert results to legacy format
-    paths_df, stats_df = convert_results_to_legacy_format(results, new_inputs)
+    # Convert results to legacy format (cached paths are shared, so the
+    # caller gets its own editable copy)
+    paths_df, stats_df = convert_results_to_legacy_format(results, new_inputs, copy=cached)
     
     # Store new metrics for later retrieval
     paths_df.attrs['new_engine_results'] = results
@@ -200,34 +263,80 @@ def calculate_goal_probabilities(
     
     Maintains compatibility with old API.
     """
-    goal_probs = []
+    if not goals:
+        return []
     
-    for goal in goals:
-        target_amount = goal['target_amount']
-        target_age = goal['target_age']
-        
-        # Calculate months to target age
-        years_to_target = target_age - current_age
-        months_to_target = years_to_target * 12
-        
-        # Get values at target month (if within simulation horizon)
-        if 0 <= months_to_target < len(paths_df):
-            values_at_target = paths_df.iloc[months_to_target, 1:].values
-            achieved = np.sum(values_at_target >= target_amount)
-            probability = achieved / len(values_at_target)
-        else:
-            probability = 0.0
-        
-        goal_probs.append({
+    paths = _paths_array(paths_df)
+    target_amounts = np.array([goal['target_amount'] for goal in goals])
+    months_to_target = np.array([(goal['target_age'] - current_age) * 12 for goal in goals])
+    
+    # Goals outside the simulation horizon get probability 0
+    in_horizon = (months_to_target >= 0) & (months_to_target < len(paths_df))
+    probabilities = np.zeros(len(goals))
+    if in_horizon.any():
+        values_at_target = paths[months_to_target[in_horizon]]
+        probabilities[in_horizon] = np.mean(
+            values_at_target >= target_amounts[in_horizon, None], axis=1
+        )
+    
+    goal_probs = [
+        {
             "name": goal['name'],
-            "target_amount": target_amount,
-            "target_age": target_age,
-            "probability": probability
-        })
+            "target_amount": goal['target_amount'],
+            "target_age": goal['target_age'],
+            "probability": float(probability)
+        }
+        for goal, probability in zip(goals, probabilities)
+    ]
     
     return goal_probs
 
 
+# Sensitivity requests with fewer variations than this run in-process
+SENSITIVITY_POOL_MIN_VARIATIONS = 4
+
+# Worker processes are started once and shared by all sensitivity requests,
+# so concurrent requests queue on the same CPU-count pool instead of each
+# spawning their own
+_sensitivity_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_sensitivity_pool() -> ProcessPoolExecutor:
+    """Shared sensitivity process pool, created on first use."""
+    global _sensitivity_pool
+    if _sensitivity_pool is None:
+        _sensitivity_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _sensitivity_pool
+
+
+def shutdown_sensitivity_pool() -> None:
+    """Stop the shared sensitivity pool's workers (called on app shutdown)."""
+    global _sensitivity_pool
+    if _sensitivity_pool is not None:
+        _sensitivity_pool.shutdown()
+        _sensitivity_pool = None
+
+
+def _sensitivity_point(args) -> Dict:
+    """Run one sensitivity variation (module-level so worker processes can pickle it)."""
+    inputs, parameter, value, seed = args
+    
+    # Create copy of inputs and modify parameter
+    test_inputs = replace(inputs, **{parameter: value})
+    
+    # Run simulation; only metrics are reported, so skip building the
+    # legacy paths DataFrame and read the engine's arrays directly
+    results = _simulate(test_inputs, seed)
+    metrics = _metrics_from_paths(results.paths.T, results.monthly_stats.iloc[-1])
+    
+    return {
+        'parameter_value': value,
+        'success_probability': metrics['success_probability'],
+        'ending_median': metrics['ending_median'],
+        'depletion_probability': metrics['depletion_probability']
+    }
+
+
 def sensitivity_analysis(
     inputs,
     parameter: str,
@@ -236,27 +345,27 @@ def sensitivity_analysis(
     """
     Run sensitivity analysis by varying a parameter.
     
-    Maintains compatibility with old API.
+    Maintains compatibility with old API. Variations are independent
+    simulations, so larger requests run on the shared sensitivity process
+    pool; small ones (or single-CPU hosts) run in-process, where pool
+    dispatch would cost more than it saves. Repeated values are simulated
+    once and share a result row.
+    
+    All variations share one random seed (common random numbers), so each
+    replays the same market shocks and differences between rows reflect
+    the parameter rather than sampling noise.
     """
-    results = []
+    unique_values = list(dict.fromkeys(variations))
+    seed = int(np.random.default_rng().integers(2**32))
+    jobs = [(inputs, parameter, value, seed) for value in unique_values]
     
-    for value in variations:
-        # Create copy of inputs and modify parameter
-        test_inputs = type(inputs)(**inputs.__dict__)
-        setattr(test_inputs, parameter, value)
-        
-        # Run simulation
-        paths_df, stats_df = run_monte_carlo_adapted(test_inputs)
-        metrics = calculate_metrics(paths_df, stats_df)
-        
-        results.append({
-            'parameter_value': value,
-            'success_probability': metrics['success_probability'],
-            'ending_median': metrics['ending_median'],
-            'depletion_probability': metrics['depletion_probability']
-        })
+    if len(jobs) < SENSITIVITY_POOL_MIN_VARIATIONS or (os.cpu_count() or 1) <= 1:
+        results = [_sensitivity_point(job) for job in jobs]
+    else:
+        results = list(_get_sensitivity_pool().map(_sensitivity_point, jobs))
     
-    return pd.DataFrame(results)
+    results_by_value = dict(zip(unique_values, results))
+    return pd.DataFrame([results_by_value[value] for value in variations])
 
 
 def get_new_engine_metrics(paths_df: pd.DataFrame) -> Optional[SimulationResults]:
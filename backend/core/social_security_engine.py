@@ -67,6 +67,7 @@ LIFE_EXPECTANCY_TABLE = {
     67: {Gender.MALE: 16.4, Gender.FEMALE: 18.6, Gender.OTHER: 17.5},
     70: {Gender.MALE: 14.0, Gender.FEMALE: 16.1, Gender.OTHER: 15.1},
 }
+LIFE_EXPECTANCY_AGES = sorted(LIFE_EXPECTANCY_TABLE)
 
 # Early claiming reduction factors
 # For each month before FRA, benefit is reduced by:
@@ -290,8 +291,7 @@ def get_life_expectancy(
         return override
     
     # Find closest age in table
-    table_ages = sorted(LIFE_EXPECTANCY_TABLE.keys())
-    closest_age = min(table_ages, key=lambda x: abs(x - current_age))
+    closest_age = min(LIFE_EXPECTANCY_AGES, key=lambda x: abs(x - current_age))
     
     remaining_years = LIFE_EXPECTANCY_TABLE[closest_age][gender]
     
@@ -375,29 +375,27 @@ def calculate_benefit_stream(
             assumptions.life_expectancy_override
         )
     
-    # Build benefit stream
-    ages = list(range(claiming_age, end_age + 1))
-    years_elapsed = [age - claiming_age for age in ages]
+    # Build benefit stream (whole columns at once; the helpers are elementwise)
+    ages = np.arange(claiming_age, end_age + 1)
+    years_elapsed = ages - claiming_age
     
     # Gross benefits with COLA
-    annual_benefits_gross = [
-        apply_cola(annual_benefit_initial, years, assumptions.cola_annual)
-        for years in years_elapsed
-    ]
+    gross = apply_cola(annual_benefit_initial, years_elapsed, assumptions.cola_annual)
     
     # After-tax benefits
-    annual_benefits_net = [
-        calculate_after_tax_benefit(
-            gross,
-            assumptions.marginal_tax_rate,
-            assumptions.ss_taxable_portion
-        )
-        for gross in annual_benefits_gross
-    ]
+    net = calculate_after_tax_benefit(
+        gross,
+        assumptions.marginal_tax_rate,
+        assumptions.ss_taxable_portion
+    )
     
     # Cumulative benefits
-    cumulative_gross = np.cumsum(annual_benefits_gross).tolist()
-    cumulative_net = np.cumsum(annual_benefits_net).tolist()
+    cumulative_gross = np.cumsum(gross).tolist()
+    cumulative_net = np.cumsum(net).tolist()
+    
+    ages = ages.tolist()
+    annual_benefits_gross = gross.tolist()
+    annual_benefits_net = net.tolist()
     
     # Cumulative with investment (for early claiming analysis)
     cumulative_invested = []
@@ -436,12 +434,10 @@ def calculate_npv(
     benefits = (benefit_stream.annual_benefits_net if use_net 
                 else benefit_stream.annual_benefits_gross)
     
-    # Discount each year's benefit
-    discount_factors = [(1 + discount_rate) ** (-i) 
-                        for i in range(len(benefits))]
+    # Discount each year's benefit (one vectorized power over all years)
+    discount_factors = np.power(1 + discount_rate, -np.arange(len(benefits), dtype=float))
     
-    npv = sum(benefit * factor 
-              for benefit, factor in zip(benefits, discount_factors))
+    npv = float(np.dot(benefits, discount_factors))
     
     return npv
 
@@ -78,8 +78,7 @@ class StochasticInflationEngine:
             seed: Random seed for reproducibility
         """
         self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         
         # Regime-specific parameters
         self.regime_params = {
@@ -195,7 +194,7 @@ class StochasticInflationEngine:
         # Generate paths using OU process
         for t in range(1, n_months):
             # Random shocks
-            dW = np.random.randn(n_scenarios) * sqrt_dt
+            dW = self.rng.standard_normal(n_scenarios) * sqrt_dt
             
             # Mean reversion term: κ(μ - I)dt
             mean_reversion = params.mean_reversion_speed * \
@@ -362,10 +361,11 @@ class StochasticInflationEngine:
         # Stack all monthly rates
         all_rates = np.array([s.monthly_rates for s in scenarios])
         
-        # Calculate percentiles at each month
+        # Calculate every requested percentile at each month in one pass
+        percentile_rates = np.percentile(all_rates, percentiles, axis=0)
+        
         percentile_paths = {}
-        for p in percentiles:
-            monthly_rates = np.percentile(all_rates, p, axis=0)
+        for p, monthly_rates in zip(percentiles, percentile_rates):
             annual_rates = self._monthly_to_annual(monthly_rates)
             cumulative_factor = self._calculate_cumulative_inflation(monthly_rates)
             
@@ -395,18 +395,18 @@ class StochasticInflationEngine:
         Returns:
             Array of inflation-adjusted spending amounts
         """
-        spending = np.zeros(n_months)
-        spending[0] = base_spending
+        rates = np.asarray(inflation_scenario.monthly_rates, dtype=float)
         
-        for t in range(1, min(n_months, len(inflation_scenario.monthly_rates))):
-            # Increase spending by monthly inflation rate
-            spending[t] = spending[t-1] * (1 + inflation_scenario.monthly_rates[t])
+        # Month t compounds at rate t; months past the scenario reuse its last rate
+        rate_idx = np.minimum(np.arange(1, n_months), len(rates) - 1)
+        
+        spending = np.empty(n_months)
+        spending[0] = base_spending
+        spending[1:] = 1 + rates[rate_idx]
         
-        # If n_months > scenario length, use last rate
-        if n_months > len(inflation_scenario.monthly_rates):
-            last_rate = inflation_scenario.monthly_rates[-1]
-            for t in range(len(inflation_scenario.monthly_rates), n_months):
-                spending[t] = spending[t-1] * (1 + last_rate)
+        # Running product gives the same left-to-right compounding as a
+        # month-by-month loop
+        np.cumprod(spending, out=spending)
         
         return spending
 
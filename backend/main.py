@@ -6,12 +6,14 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import gc
 import time
 from datetime import datetime
 import logging
 
 from api import simulation, presets, health, social_security, tax_optimization, goals, enhanced_simulation, annuity, estate_planning
 from models.schemas import HealthCheckResponse
+from core.simulation_adapter import shutdown_sensitivity_pool
 
 # Configure logging
 logging.basicConfig(
@@ -29,7 +31,14 @@ APP_NAME = "Salem Investment Counselors - Portfolio Analysis API"
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     logger.info(f"Starting {APP_NAME} v{APP_VERSION}")
+    # Move everything allocated during import/startup (modules, routers,
+    # schemas) into the permanent generation so per-request collections
+    # driven by simulation arrays and DataFrames don't keep rescanning it.
+    gc.collect()
+    gc.freeze()
     yield
+    shutdown_sensitivity_pool()
+    gc.unfreeze()
     logger.info(f"Shutting down {APP_NAME}")
 
 
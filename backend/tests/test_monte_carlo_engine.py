@@ -27,7 +27,9 @@ from core.monte_carlo_engine import (
     run_monte_carlo_simulation,
     compute_portfolio_statistics,
     generate_returns_geometric_brownian_motion,
+    correlation_cholesky,
     calculate_required_minimum_distribution,
+    rmd_divisor_schedule,
     deterministic_test,
     run_stress_test
 )
@@ -229,6 +231,40 @@ class TestReturnGeneration:
             rng=np.random.default_rng(12345)
         )
         assert np.allclose(returns1, returns2)
+    
+    @pytest.mark.parametrize("n_scenarios", [1, 511, 512, 1300])
+    def test_month_major_matches_transpose(self, n_scenarios):
+        """Month-major layout should hold the same draws, contiguous by month"""
+        scenario_major = generate_returns_geometric_brownian_motion(
+            mu_annual=0.07,
+            sigma_annual=0.15,
+            n_scenarios=n_scenarios,
+            n_months=24,
+            rng=np.random.default_rng(12345)
+        )
+        month_major = generate_returns_geometric_brownian_motion(
+            mu_annual=0.07,
+            sigma_annual=0.15,
+            n_scenarios=n_scenarios,
+            n_months=24,
+            rng=np.random.default_rng(12345),
+            month_major=True
+        )
+        assert month_major.shape == (24, n_scenarios)
+        assert month_major.flags.c_contiguous
+        assert np.array_equal(month_major, scenario_major.T)
+    
+    def test_correlation_cholesky_cached(self):
+        """Cholesky factor reproduces the correlation matrix and is shared"""
+        L = correlation_cholesky(0.1, 0.0, 0.2)
+        corr = np.array([
+            [1.0, 0.1, 0.0],
+            [0.1, 1.0, 0.2],
+            [0.0, 0.2, 1.0]
+        ])
+        assert np.allclose(L @ L.T, corr)
+        assert correlation_cholesky(0.1, 0.0, 0.2) is L
+        assert not L.flags.writeable
 
 
 class TestRMDCalculation:
@@ -264,6 +300,16 @@ class TestRMDCalculation:
         rmd_90 = calculate_required_minimum_distribution(500_000, 90, rmd_factors)
         
         assert rmd_73 < rmd_80 < rmd_90
+    
+    def test_divisor_schedule_matches_scalar_rmd(self):
+        """Vectorized divisor lookup should match the scalar RMD per age"""
+        rmd_factors = {73: 26.5, 74: 25.5, 75: 24.6}
+        ages = np.array([70, 72, 73, 74, 75, 80])
+        divisors = rmd_divisor_schedule(ages, rmd_factors)
+        
+        for age, divisor in zip(ages, divisors):
+            expected = calculate_required_minimum_distribution(500_000, int(age), rmd_factors)
+            assert np.isclose(500_000 / divisor, expected)
 
 
 class TestDeterministicScenarios:
@@ -351,6 +397,28 @@ class TestSimulationBasics:
         
         assert np.all(results.paths[:, 0] == 1_000_000)
     
+    def test_paths_layout_is_month_major(self):
+        """paths is a month-major view; a scenario-major copy holds the same values"""
+        inputs = PortfolioInputs(
+            starting_portfolio=1_000_000,
+            years_to_model=5,
+            current_age=65,
+            n_scenarios=50,
+            random_seed=42
+        )
+        results = run_monte_carlo_simulation(inputs)
+        paths = results.paths
+        
+        assert paths.shape == (50, 61)
+        assert paths.T.flags.c_contiguous
+        assert not paths.flags.c_contiguous
+        
+        scenario_major = np.ascontiguousarray(paths)
+        assert scenario_major.flags.c_contiguous
+        assert np.array_equal(scenario_major, paths)
+        assert np.array_equal(paths.reshape(-1), scenario_major.reshape(-1))
+        assert np.array_equal(paths.reshape(-1)[:61], paths[0])
+    
     def test_paths_non_negative(self):
         """Portfolio values should never be negative"""
         inputs = PortfolioInputs(
@@ -380,6 +448,31 @@ class TestSimulationBasics:
         
         assert np.allclose(results1.paths, results2.paths)
         assert results1.success_probability == results2.success_probability
+    
+    @pytest.mark.parametrize("spending_rule", list(SpendingRule))
+    def test_numba_loop_matches_numpy_loop(self, monkeypatch, spending_rule):
+        """Compiled month loop should reproduce the NumPy loop exactly"""
+        pytest.importorskip("numba")
+        import core.monte_carlo_engine as engine
+        
+        inputs = PortfolioInputs(
+            starting_portfolio=1_000_000,
+            years_to_model=30,
+            current_age=62,
+            monthly_spending=5_000,
+            spending_rule=spending_rule,
+            use_guardrails=True,
+            use_lifestyle_phases=True,
+            n_scenarios=200,
+            random_seed=7
+        )
+        monkeypatch.setattr(engine, "NUMBA_MIN_SCENARIOS", 10**9)
+        numpy_results = run_monte_carlo_simulation(inputs)
+        monkeypatch.setattr(engine, "NUMBA_MIN_SCENARIOS", 1)
+        numba_results = run_monte_carlo_simulation(inputs)
+        
+        assert np.array_equal(numpy_results.paths, numba_results.paths)
+        assert numpy_results.success_probability == numba_results.success_probability
 
 
 class TestPropertyInvariants:
@@ -0,0 +1,282 @@
+"""
+Test Suite for the Legacy Simulation Module
+===========================================
+
+Checks the vectorized legacy simulation (core/simulation.py) against plain
+per-scenario reference loops on small, fixed-seed inputs.
+
+Run with: pytest test_simulation.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.simulation import (
+    PortfolioInputs,
+    compute_portfolio_return_and_vol,
+    run_monte_carlo,
+    calculate_metrics,
+    calculate_goal_probabilities,
+    sensitivity_analysis,
+    _simulate_paths,
+    _path_metrics,
+)
+
+
+def make_inputs(**overrides) -> PortfolioInputs:
+    """Small retirement scenario with income and healthcare in the horizon."""
+    params = dict(
+        starting_portfolio=1_000_000,
+        years_to_model=15,
+        current_age=62,
+        monthly_income=0,
+        monthly_spending=4_000,
+        inflation_annual=0.03,
+        equity_pct=0.6,
+        fi_pct=0.35,
+        cash_pct=0.05,
+        equity_return_annual=0.07,
+        fi_return_annual=0.04,
+        cash_return_annual=0.02,
+        equity_vol_annual=0.16,
+        fi_vol_annual=0.05,
+        cash_vol_annual=0.01,
+        n_scenarios=40,
+        social_security_monthly=2_000,
+        ss_start_age=67,
+        pension_monthly=500,
+        pension_start_age=65,
+        monthly_healthcare=400,
+        healthcare_start_age=65,
+    )
+    params.update(overrides)
+    return PortfolioInputs(**params)
+
+
+def reference_paths(inputs: PortfolioInputs, seed: int) -> np.ndarray:
+    """Month-by-month, scenario-by-scenario version of the legacy loop."""
+    rng = np.random.default_rng(seed)
+    exp_annual, vol_annual = compute_portfolio_return_and_vol(inputs)
+    months = inputs.years_to_model * 12
+    z = rng.standard_normal((months, inputs.n_scenarios))
+    
+    paths = np.zeros((inputs.n_scenarios, months + 1))
+    for i in range(inputs.n_scenarios):
+        value = inputs.starting_portfolio
+        paths[i, 0] = value
+        for month in range(1, months + 1):
+            age_months = inputs.current_age * 12 + month
+            
+            exp_monthly = exp_annual / 12.0
+            if inputs.use_glide_path:
+                equity = inputs.equity_pct + (inputs.target_equity_at_end - inputs.equity_pct) * month / months
+                exp_monthly = (equity * inputs.equity_return_annual + (1 - equity) * inputs.fi_return_annual) / 12.0
+            growth = 1.0 + exp_monthly + vol_annual / np.sqrt(12.0) * z[month - 1, i]
+            
+            income = 0.0
+            if age_months >= inputs.ss_start_age * 12:
+                income += inputs.social_security_monthly
+            if age_months >= inputs.pension_start_age * 12:
+                income += inputs.pension_monthly
+            
+            healthcare = 0.0
+            if age_months >= inputs.healthcare_start_age * 12:
+                months_since = month - (inputs.healthcare_start_age * 12 - inputs.current_age * 12)
+                healthcare = inputs.monthly_healthcare * (1 + inputs.healthcare_inflation / 12.0) ** months_since
+            
+            if inputs.spending_rule == 1:
+                spending = abs(inputs.monthly_spending) * (1 + inputs.inflation_annual / 12.0) ** month
+            else:
+                spending = value * inputs.spending_pct_annual / 12.0
+            
+            value = value * growth - (spending + healthcare - income)
+            value = max(value, 0.0)
+            paths[i, month] = value
+    return paths
+
+
+def reference_path_metrics(paths: np.ndarray) -> dict:
+    """Per-path depletion scan over a (n_scenarios, months + 1) array."""
+    final_values = paths[:, -1]
+    depleted_count = 0
+    years_to_depletion = []
+    for values in paths:
+        depletion_months = np.where(values <= 0)[0]
+        if len(depletion_months) > 0:
+            depleted_count += 1
+            years_to_depletion.append(depletion_months[0] / 12.0)
+    return {
+        "success_probability": float(np.mean(final_values > 0)),
+        "depletion_probability": depleted_count / len(paths),
+        "years_depleted": float(np.mean(years_to_depletion)) if years_to_depletion else 0.0,
+        "shortfall_risk": float(np.mean(final_values < paths[0, 0] * 0.5)),
+    }
+
+
+def reference_goal_probabilities(paths_df, goals, current_age) -> list:
+    """One .iloc lookup per goal, as the goal loop was written originally."""
+    scenario_cols = [col for col in paths_df.columns if col.startswith("Scenario_")]
+    results = []
+    for goal in goals:
+        years_from_now = goal.get("target_age", 0) - current_age
+        if years_from_now < 0:
+            continue
+        month_index = min(years_from_now * 12, len(paths_df) - 1)
+        values_at_goal = paths_df.iloc[month_index][scenario_cols].values
+        results.append({
+            "goal_name": goal.get("name", "Goal"),
+            "target_amount": goal.get("target_amount", 0),
+            "target_age": goal.get("target_age", 0),
+            "probability": float(np.mean(values_at_goal >= goal.get("target_amount", 0))),
+            "median_value": float(np.median(values_at_goal)),
+        })
+    return results
+
+
+class TestSimulatePaths:
+    """Vectorized month loop against the reference loop"""
+    
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"spending_rule": 2},
+        {"use_glide_path": True},
+    ])
+    def test_matches_reference_loop(self, overrides):
+        """Fixed-seed paths should match the per-scenario reference"""
+        inputs = make_inputs(**overrides)
+        
+        paths = _simulate_paths(inputs, seed=123)
+        
+        assert paths.shape == (inputs.n_scenarios, inputs.years_to_model * 12 + 1)
+        np.testing.assert_allclose(paths, reference_paths(inputs, seed=123), rtol=1e-9, atol=1e-6)
+    
+    def test_zero_volatility_is_deterministic(self):
+        """With no volatility every scenario follows the same path"""
+        inputs = make_inputs(equity_vol_annual=0.0, fi_vol_annual=0.0, cash_vol_annual=0.0)
+        
+        paths = _simulate_paths(inputs, seed=1)
+        
+        assert np.allclose(paths, paths[0])
+        np.testing.assert_allclose(paths, reference_paths(inputs, seed=1), rtol=1e-12)
+
+
+class TestPathMetrics:
+    """Vectorized path metrics against a per-path scan"""
+    
+    def test_edge_case_paths(self):
+        """Depleted, recovered, shortfall and healthy paths"""
+        paths = np.array([
+            [100.0, 50.0, 0.0, 0.0, 0.0],      # depleted in month 2
+            [100.0, 120.0, 130.0, 140.0, 150.0],  # never depleted
+            [100.0, 0.0, 20.0, 30.0, 45.0],    # depleted, then income refills it
+            [100.0, 60.0, 45.0, 40.0, 40.0],   # shortfall without depletion
+            [100.0, 10.0, 5.0, 1.0, 0.0],      # depleted in the last month
+        ])
+        
+        assert _path_metrics(paths) == pytest.approx(reference_path_metrics(paths))
+    
+    def test_no_depleted_paths(self):
+        """years_depleted should be 0 when nothing depletes"""
+        paths = np.full((3, 13), 100.0)
+        
+        metrics = _path_metrics(paths)
+        
+        assert metrics == pytest.approx(reference_path_metrics(paths))
+        assert metrics["years_depleted"] == 0.0
+        assert metrics["depletion_probability"] == 0.0
+    
+    def test_simulated_paths_with_depletion(self):
+        """Fixed-seed run with heavy spending should match the reference"""
+        inputs = make_inputs(monthly_spending=9_000, n_scenarios=200)
+        paths_df, stats_df = run_monte_carlo(inputs, seed=17)
+        paths = paths_df.drop(columns="Month").to_numpy().T
+        
+        reference = reference_path_metrics(paths)
+        metrics = calculate_metrics(paths_df, stats_df)
+        
+        assert 0 < reference["depletion_probability"] < 1
+        for key, value in reference.items():
+            assert metrics[key] == pytest.approx(value)
+        assert metrics["ending_median"] == pytest.approx(np.median(paths[:, -1]))
+
+
+class TestGoalProbabilities:
+    """Vectorized goal probabilities against the per-goal loop"""
+    
+    @staticmethod
+    def goal_frame() -> pd.DataFrame:
+        """Three scenarios over two years; month 12 holds 100, 200 and 300."""
+        months = np.arange(25)
+        paths_df = pd.DataFrame({
+            "Scenario_0": np.where(months < 12, 50.0, 100.0),
+            "Scenario_1": np.where(months < 12, 50.0, 200.0),
+            "Scenario_2": np.where(months < 12, 50.0, 300.0),
+        })
+        paths_df["Month"] = months
+        return paths_df
+    
+    def test_edge_cases_match_reference(self):
+        """Exact thresholds, past goals, today and beyond the horizon"""
+        paths_df = self.goal_frame()
+        goals = [
+            {"name": "Exactly met", "target_amount": 200.0, "target_age": 61},
+            {"name": "All met exactly", "target_amount": 100.0, "target_age": 61},
+            {"name": "Just missed", "target_amount": 300.01, "target_age": 61},
+            {"name": "Past goal", "target_amount": 10.0, "target_age": 59},
+            {"name": "Today", "target_amount": 50.0, "target_age": 60},
+            {"name": "Beyond horizon", "target_amount": 250.0, "target_age": 90},
+            {"target_amount": 0.0, "target_age": 62},
+        ]
+        
+        results = calculate_goal_probabilities(paths_df, goals, current_age=60)
+        
+        assert results == reference_goal_probabilities(paths_df, goals, current_age=60)
+        assert [r["probability"] for r in results] == pytest.approx([2 / 3, 1.0, 0.0, 1.0, 1 / 3, 1.0])
+        assert "Past goal" not in [r["goal_name"] for r in results]
+    
+    def test_no_goals_in_range(self):
+        """Only past goals should give an empty result"""
+        goals = [{"name": "Past", "target_amount": 10.0, "target_age": 50}]
+        
+        assert calculate_goal_probabilities(self.goal_frame(), goals, current_age=60) == []
+        assert calculate_goal_probabilities(self.goal_frame(), [], current_age=60) == []
+    
+    def test_simulated_paths_match_reference(self):
+        """Fixed-seed run should match the per-goal loop"""
+        paths_df, _ = run_monte_carlo(make_inputs(), seed=21)
+        goals = [
+            {"name": f"Goal {age}", "target_amount": amount, "target_age": age}
+            for age, amount in [(63, 900_000), (70, 800_000), (77, 500_000), (80, 1.0)]
+        ]
+        
+        results = calculate_goal_probabilities(paths_df, goals, current_age=62)
+        
+        assert results == reference_goal_probabilities(paths_df, goals, current_age=62)
+
+
+class TestSensitivityAnalysis:
+    """Variations are simulated on common random numbers"""
+    
+    def test_variations_share_random_draws(self):
+        """A parameter the simulation ignores should give identical rows"""
+        # monthly_income is not used by the simulation, so rows only agree
+        # if every variation replays the same draws
+        results = sensitivity_analysis(make_inputs(), "monthly_income", [0.0, 1_000.0, 2_000.0])
+        
+        metrics = results.drop(columns="parameter_value")
+        assert (metrics.nunique() == 1).all()
+    
+    def test_success_is_monotonic_in_return(self):
+        """On shared draws a higher return can never lower success"""
+        returns = [0.03, 0.05, 0.07, 0.09]
+        results = sensitivity_analysis(make_inputs(monthly_spending=7_000), "equity_return_annual", returns)
+        
+        assert list(results["parameter_value"]) == returns
+        assert results["success_probability"].is_monotonic_increasing
+        assert results["ending_median"].is_monotonic_increasing
@@ -0,0 +1,264 @@
+"""
+Test Suite for the Engine Adapter
+=================================
+
+Checks the legacy-format helpers in core/simulation_adapter.py against
+plain per-scenario reference implementations.
+
+Run with: pytest test_simulation_adapter.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.simulation import PortfolioInputs
+from core.simulation_adapter import (
+    run_monte_carlo_adapted,
+    _paths_array,
+    calculate_metrics,
+    calculate_goal_probabilities,
+    sensitivity_analysis,
+)
+
+
+def make_inputs(**overrides) -> PortfolioInputs:
+    """Small legacy-format inputs for the engine adapter."""
+    params = dict(
+        starting_portfolio=1_000_000,
+        years_to_model=10,
+        current_age=65,
+        monthly_income=0,
+        monthly_spending=6_000,
+        inflation_annual=0.03,
+        equity_pct=0.6,
+        fi_pct=0.35,
+        cash_pct=0.05,
+        equity_return_annual=0.07,
+        fi_return_annual=0.04,
+        cash_return_annual=0.02,
+        equity_vol_annual=0.18,
+        fi_vol_annual=0.05,
+        cash_vol_annual=0.01,
+        n_scenarios=100,
+    )
+    params.update(overrides)
+    return PortfolioInputs(**params)
+
+
+def legacy_frames(paths: np.ndarray):
+    """(paths_df, stats_df) in the adapter's format from a (months, n) array."""
+    paths_df = pd.DataFrame(paths, columns=[f"scenario_{i}" for i in range(paths.shape[1])])
+    paths_df.insert(0, "month", range(len(paths)))
+    stats_df = pd.DataFrame({
+        "median": np.median(paths, axis=1),
+        "p10": np.percentile(paths, 10, axis=1),
+        "p90": np.percentile(paths, 90, axis=1),
+    })
+    return paths_df, stats_df
+
+
+def reference_years_depleted(paths_df: pd.DataFrame) -> float:
+    """Per-scenario scan for the first zero month of failed scenarios."""
+    years = []
+    for col in paths_df.columns[1:]:
+        values = paths_df[col].values
+        if values[-1] == 0:
+            depletion_month = np.argmax(values == 0)
+            if depletion_month > 0:
+                years.append(depletion_month / 12)
+    return float(np.mean(years)) if years else 0.0
+
+
+def reference_goal_probabilities(paths_df, goals, current_age) -> list:
+    """One .iloc lookup per goal, as the goal loop was written originally."""
+    results = []
+    for goal in goals:
+        months_to_target = (goal['target_age'] - current_age) * 12
+        if 0 <= months_to_target < len(paths_df):
+            values_at_target = paths_df.iloc[months_to_target, 1:].values
+            probability = np.sum(values_at_target >= goal['target_amount']) / len(values_at_target)
+        else:
+            probability = 0.0
+        results.append({
+            "name": goal['name'],
+            "target_amount": goal['target_amount'],
+            "target_age": goal['target_age'],
+            "probability": probability,
+        })
+    return results
+
+
+class TestCalculateMetrics:
+    """Vectorized metrics against a per-scenario scan"""
+    
+    def test_edge_case_paths(self):
+        """Failed, recovered, healthy and zero-start scenarios"""
+        paths = np.array([
+            [100.0, 50.0, 0.0, 0.0],      # depleted in month 2
+            [100.0, 120.0, 130.0, 140.0],  # healthy
+            [100.0, 0.0, 20.0, 0.0],      # hit zero, recovered, failed again
+            [0.0, 0.0, 0.0, 0.0],         # zero from the start
+            [100.0, 0.0, 30.0, 10.0],     # hit zero but recovered
+        ]).T  # (months, n_scenarios)
+        paths_df, stats_df = legacy_frames(paths)
+        
+        metrics = calculate_metrics(paths_df, stats_df)
+        
+        assert metrics["years_depleted"] == pytest.approx(reference_years_depleted(paths_df))
+        assert metrics["success_probability"] == pytest.approx(0.4)
+        assert metrics["depletion_probability"] == pytest.approx(0.6)
+    
+    def test_engine_paths_match_reference(self):
+        """Seeded engine run with depletion should match the reference"""
+        paths_df, stats_df = run_monte_carlo_adapted(make_inputs(monthly_spending=9_000), seed=3)
+        ending = paths_df.iloc[-1, 1:].to_numpy()
+        
+        metrics = calculate_metrics(paths_df, stats_df)
+        
+        assert 0 < np.mean(ending == 0) < 1
+        assert metrics["years_depleted"] == pytest.approx(reference_years_depleted(paths_df))
+        assert metrics["success_probability"] == pytest.approx(np.mean(ending > 0))
+
+
+class TestGoalProbabilities:
+    """Vectorized goal probabilities against the per-goal loop"""
+    
+    def test_edge_cases_match_reference(self):
+        """Exact thresholds, past goals, horizon bounds"""
+        months = np.arange(25)
+        paths = np.column_stack([
+            np.where(months < 12, 50.0, 100.0),
+            np.where(months < 12, 50.0, 200.0),
+            np.where(months < 12, 50.0, 300.0),
+        ])
+        paths_df, _ = legacy_frames(paths)
+        goals = [
+            {"name": "Exactly met", "target_amount": 200.0, "target_age": 61},
+            {"name": "Just missed", "target_amount": 300.01, "target_age": 61},
+            {"name": "Past goal", "target_amount": 10.0, "target_age": 59},
+            {"name": "Today", "target_amount": 50.0, "target_age": 60},
+            {"name": "Last month", "target_amount": 100.0, "target_age": 62},
+            {"name": "Beyond horizon", "target_amount": 1.0, "target_age": 63},
+        ]
+        
+        results = calculate_goal_probabilities(paths_df, goals, current_age=60)
+        
+        assert results == reference_goal_probabilities(paths_df, goals, current_age=60)
+        assert [r["probability"] for r in results] == pytest.approx([2 / 3, 0.0, 0.0, 1.0, 1.0, 0.0])
+    
+    def test_no_goals(self):
+        """An empty goal list gives an empty result"""
+        paths_df, _ = legacy_frames(np.ones((13, 2)))
+        
+        assert calculate_goal_probabilities(paths_df, [], current_age=60) == []
+    
+    def test_engine_paths_match_reference(self):
+        """Seeded engine run should match the per-goal loop"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs(), seed=8)
+        goals = [
+            {"name": f"Goal {age}", "target_amount": amount, "target_age": age}
+            for age, amount in [(65, 1_000_000), (68, 900_000), (72, 600_000), (75, 1.0)]
+        ]
+        
+        results = calculate_goal_probabilities(paths_df, goals, current_age=65)
+        
+        assert results == reference_goal_probabilities(paths_df, goals, current_age=65)
+
+
+class TestSeededCache:
+    """Seeded runs are memoized without sharing mutable state"""
+    
+    def test_mutating_returned_frame_does_not_change_cached_result(self):
+        """Edits to one call's paths_df must not leak into the next call"""
+        inputs = make_inputs()
+        first_df, _ = run_monte_carlo_adapted(inputs, seed=11)
+        expected = first_df.to_numpy().copy()
+        
+        first_df.iloc[:, 1:] = -1.0
+        first_df["scenario_0"] *= 0
+        second_df, _ = run_monte_carlo_adapted(inputs, seed=11)
+        
+        assert np.array_equal(second_df.to_numpy(), expected)
+    
+    def test_cached_arrays_are_read_only(self):
+        """Shared engine results cannot be modified in place"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs(), seed=12)
+        results = paths_df.attrs['new_engine_results']
+        
+        assert not results.paths.flags.writeable
+        with pytest.raises(ValueError):
+            results.paths[0, 0] = 0.0
+    
+    def test_unseeded_runs_are_not_frozen(self):
+        """Unseeded results are private to the caller and stay writable"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs())
+        
+        paths_df.iloc[0, 1] = 0.0
+        assert paths_df.attrs['new_engine_results'].paths.flags.writeable
+
+
+class TestPathsArray:
+    """Engine paths are only reused for the frame they were wrapped in"""
+    
+    def test_unsliced_frame_reads_engine_paths(self):
+        """The frame returned by the adapter reuses the engine's array"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs())
+        results = paths_df.attrs['new_engine_results']
+        
+        paths = _paths_array(paths_df)
+        
+        assert np.shares_memory(paths, results.paths)
+        assert np.array_equal(paths, paths_df.iloc[:, 1:].to_numpy())
+    
+    @pytest.mark.parametrize("select", [
+        lambda df: df.iloc[:24],
+        lambda df: df.iloc[:, :11],
+        lambda df: df.iloc[::-1],
+        lambda df: df.iloc[::-1].reset_index(drop=True),
+        lambda df: df.copy(),
+    ])
+    def test_derived_frames_use_their_own_values(self, select):
+        """Slices and copies keep attrs but must not read the full engine paths"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs())
+        derived = select(paths_df)
+        
+        assert derived.attrs['new_engine_results'] is not None
+        assert np.array_equal(_paths_array(derived), derived.iloc[:, 1:].to_numpy())
+    
+    def test_goal_probabilities_on_sliced_frame(self):
+        """Goal lookups on a truncated frame respect the truncated horizon"""
+        paths_df, _ = run_monte_carlo_adapted(make_inputs(), seed=4)
+        first_year = paths_df.iloc[:13]
+        goals = [{"name": "Year 2", "target_amount": 1.0, "target_age": 67}]
+        
+        results = calculate_goal_probabilities(first_year, goals, current_age=65)
+        
+        assert results[0]["probability"] == 0.0
+
+
+class TestSensitivityAnalysis:
+    """Variations are simulated on common random numbers"""
+    
+    def test_variations_share_random_draws(self):
+        """A parameter the simulation ignores should give identical rows"""
+        # monthly_income is not used by the simulation, so rows only agree
+        # if every variation replays the same draws
+        results = sensitivity_analysis(make_inputs(), "monthly_income", [0.0, 1_000.0, 2_000.0])
+        
+        metrics = results.drop(columns="parameter_value")
+        assert (metrics.nunique() == 1).all()
+    
+    def test_success_is_monotonic_in_return(self):
+        """On shared draws a higher return can never lower success"""
+        returns = [0.03, 0.05, 0.07, 0.09]
+        results = sensitivity_analysis(make_inputs(monthly_spending=7_000), "equity_return_annual", returns)
+        
+        assert list(results["parameter_value"]) == returns
+        assert results["success_probability"].is_monotonic_increasing
+        assert results["ending_median"].is_monotonic_increasing
@@ -25,6 +25,24 @@ INSTITUTIONAL_COLORS = {
     }
 }
 
+
+# Axis styling shared by the charts that style their axes
+INSTITUTIONAL_AXIS = {
+    'labelColor': INSTITUTIONAL_COLORS['neutral'],
+    'titleColor': INSTITUTIONAL_COLORS['primary'],
+    'gridColor': '#E5E7EB',
+    'domainColor': '#D1D5DB'
+}
+
+
+def _apply_institutional_config(chart: alt.Chart, **axis) -> alt.Chart:
+    """Borderless view plus any axis config, applied to this chart only."""
+    chart = chart.configure_view(strokeWidth=0)
+    if axis:
+        chart = chart.configure_axis(**axis)
+    return chart
+
+
 def create_institutional_fan_chart(stats_df: pd.DataFrame, 
                                    title: str = "Portfolio Projection",
                                    show_annotations: bool = True,
@@ -166,16 +184,9 @@ def create_institutional_fan_chart(stats_df: pd.DataFrame,
             'anchor': 'start',
             'color': INSTITUTIONAL_COLORS['primary']
         }
-    ).configure_view(
-        strokeWidth=0
-    ).configure_axis(
-        labelColor=INSTITUTIONAL_COLORS['neutral'],
-        titleColor=INSTITUTIONAL_COLORS['primary'],
-        gridColor='#E5E7EB',
-        domainColor='#D1D5DB'
     )
     
-    return chart
+    return _apply_institutional_config(chart, **INSTITUTIONAL_AXIS)
 
 
 def create_waterfall_chart(cashflows: pd.DataFrame, 
@@ -240,11 +251,9 @@ def create_waterfall_chart(cashflows: pd.DataFrame,
             'fontWeight': 600,
             'anchor': 'start'
         }
-    ).configure_view(
-        strokeWidth=0
     )
     
-    return chart
+    return _apply_institutional_config(chart)
 
 
 def create_scenario_comparison_chart(scenarios: Dict[str, pd.DataFrame],
@@ -256,8 +265,8 @@ def create_scenario_comparison_chart(scenarios: Dict[str, pd.DataFrame],
     Each scenario gets a distinct color and line style.
     """
     
-    # Prepare data
-    comparison_data = []
+    # Prepare data: stack each column once rather than copying a frame per
+    # scenario and concatenating the copies
     colors_list = [
         INSTITUTIONAL_COLORS['primary'],
         INSTITUTIONAL_COLORS['success'],
@@ -266,13 +275,16 @@ def create_scenario_comparison_chart(scenarios: Dict[str, pd.DataFrame],
         INSTITUTIONAL_COLORS['neutral']
     ]
     
-    for idx, (scenario_name, stats_df) in enumerate(scenarios.items()):
-        scenario_data = stats_df[['Month', metric]].copy()
-        scenario_data['Scenario'] = scenario_name
-        scenario_data['Color'] = colors_list[idx % len(colors_list)]
-        comparison_data.append(scenario_data)
+    names = list(scenarios.keys())
+    frames = list(scenarios.values())
+    lengths = [len(stats_df) for stats_df in frames]
     
-    combined_df = pd.concat(comparison_data, ignore_index=True)
+    combined_df = pd.DataFrame({
+        'Month': np.concatenate([stats_df['Month'].to_numpy() for stats_df in frames]),
+        metric: np.concatenate([stats_df[metric].to_numpy() for stats_df in frames]),
+        'Scenario': np.repeat(names, lengths),
+        'Color': np.repeat([colors_list[idx % len(colors_list)] for idx in range(len(names))], lengths)
+    })
     
     # Create chart
     chart = alt.Chart(combined_df).mark_line(size=2.5, point=False).encode(
@@ -310,14 +322,13 @@ def create_scenario_comparison_chart(scenarios: Dict[str, pd.DataFrame],
             'fontWeight': 600,
             'anchor': 'start'
         }
-    ).configure_view(
-        strokeWidth=0
-    ).configure_axis(
-        gridColor='#E5E7EB',
-        domainColor='#D1D5DB'
     )
     
-    return chart
+    return _apply_institutional_config(
+        chart,
+        gridColor=INSTITUTIONAL_AXIS['gridColor'],
+        domainColor=INSTITUTIONAL_AXIS['domainColor']
+    )
 
 
 def create_success_gauge(probability: float, 
@@ -466,8 +477,6 @@ def create_distribution_histogram(final_values: np.ndarray,
             'fontWeight': 600,
             'anchor': 'start'
         }
-    ).configure_view(
-        strokeWidth=0
     )
     
-    return chart
+    return _apply_institutional_config(chart)
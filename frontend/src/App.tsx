@@ -1,10 +1,10 @@
+import { lazy, Suspense } from 'react';
 import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
 import AppLayout from './components/layout/AppLayout';
 import { ErrorBoundary } from './components/ui';
 import Dashboard from './pages/Dashboard';
 import InputsPage from './pages/InputsPage';
 import ScenariosPage from './pages/ScenariosPage';
-import ReportsPage from './pages/ReportsPage';
 import SalemReportPage from './pages/SalemReportPage';
 import MonteCarloAnalyticsPage from './pages/MonteCarloAnalyticsPage';
 import SocialSecurityOptimization from './pages/SocialSecurityOptimization';
@@ -13,7 +13,10 @@ import EstatePlanningPage from './pages/EstatePlanningPage';
 import TaxOptimizationPage from './pages/TaxOptimizationPage';
 import GoalPlanningPage from './pages/GoalPlanningPage';
 import PresentationMode from './presentation/PresentationMode';
-import './index.css';
+
+// Loaded on demand so its print stylesheet is split out of the
+// render-blocking CSS that every page pays for on first load
+const ReportsPage = lazy(() => import('./pages/ReportsPage'));
 
 function App() {
   return (
@@ -34,7 +37,7 @@ function App() {
                 <Route path="/" element={<Dashboard />} />
                 <Route path="/inputs" element={<InputsPage />} />
                 <Route path="/scenarios" element={<ScenariosPage />} />
-                <Route path="/reports" element={<ReportsPage />} />
+                <Route path="/reports" element={<Suspense fallback={null}><ReportsPage /></Suspense>} />
                 <Route path="/analytics" element={<MonteCarloAnalyticsPage />} />
                 <Route path="/social-security" element={<SocialSecurityOptimization />} />
                 <Route path="/annuity" element={<AnnuityPage />} />
@@ -46,7 +46,7 @@ const AppHeader: React.FC = () => {
 
   return (
     <header 
-      className="bg-background-elevated border-b border-background-border shadow-lg sticky top-0 z-dropdown backdrop-blur-sm"
+      className="bg-background-elevated border-b border-background-border shadow-lg sticky top-0 z-dropdown"
       role="banner"
       aria-label="Site header"
     >
@@ -72,7 +72,7 @@ const AppHeader: React.FC = () => {
           {hasRunSimulation && (
             <button
               onClick={() => navigate('/presentation')}
-              className="hidden md:inline-flex items-center gap-2 px-4 lg:px-6 py-2 lg:py-3 bg-accent-gold text-text-primary font-semibold rounded-sm transition-all hover:bg-accent-gold-light shadow-md hover:shadow-lg"
+              className="hidden md:inline-flex items-center gap-2 px-4 lg:px-6 py-2 lg:py-3 bg-accent-gold text-text-primary font-semibold rounded-sm transition hover:bg-accent-gold-light shadow-md hover:shadow-lg"
               title="Enter Presentation Mode"
             >
               <Presentation size={18} />
@@ -39,7 +39,7 @@ const AppLayout: React.FC<AppLayoutProps> = ({ children }) => {
       <div className="lg:hidden fixed bottom-6 right-6 z-50">
         <button
           onClick={() => setIsMobileMenuOpen(!isMobileMenuOpen)}
-          className="flex items-center justify-center w-14 h-14 bg-accent-gold text-background-base rounded-full shadow-lg hover:shadow-xl transition-all duration-fast hover:scale-105"
+          className="flex items-center justify-center w-14 h-14 bg-accent-gold text-background-base rounded-full shadow-lg hover:shadow-xl transition duration-fast hover:scale-105"
           aria-label={isMobileMenuOpen ? 'Close menu' : 'Open menu'}
           aria-expanded={isMobileMenuOpen}
         >
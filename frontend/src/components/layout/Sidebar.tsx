@@ -110,7 +110,7 @@ const Sidebar: React.FC = () => {
                   <Link
                     to={item.path}
                     className={`
-                      group flex items-start gap-3 px-3 py-2.5 rounded-sm transition-all duration-fast
+                      group flex items-start gap-3 px-3 py-2.5 rounded-sm transition-colors duration-fast
                       ${isActive
                         ? 'bg-primary-navy text-white shadow-md'
                         : 'text-text-secondary hover:bg-background-hover hover:text-text-primary'
@@ -158,7 +158,7 @@ export const MonteCarloAnalytics: React.FC<MonteCarloAnalyticsProps> = () => {
               key={section.id}
               onClick={() => setActiveSection(section.id)}
               className={`
-                px-4 py-2 rounded-sm text-small font-medium transition-all duration-fast
+                px-4 py-2 rounded-sm text-small font-medium transition-colors duration-fast
                 ${activeSection === section.id
                   ? 'bg-accent-gold text-background-base shadow-sm'
                   : 'bg-background-hover text-text-secondary hover:bg-background-border hover:text-text-primary'
@@ -68,13 +68,16 @@ export const formatCurrency = (value: number, decimals: number = 0): string => {
   return `$${value.toFixed(decimals)}`;
 };
 
+// Formatter construction is costly; build it once at module load
+const currencyFullFormatter = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0,
+});
+
 export const formatCurrencyFull = (value: number): string => {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(value);
+  return currencyFullFormatter.format(value);
 };
 
 // Percentage formatting
@@ -131,14 +134,16 @@ export const getRiskLevel = (successProbability: number): RiskLevel => {
   };
 };
 
-// Tooltip styling for recharts
-export const getTooltipStyle = () => ({
+// Tooltip styling for recharts (constant, so computed once at module load)
+const tooltipStyle = {
   backgroundColor: chartTheme.tooltipBackground,
   border: `1px solid ${chartTheme.tooltipBorder}`,
   borderRadius: '8px',
   padding: '12px',
   boxShadow: '0 2px 8px rgba(0,0,0,0.15)',
-});
+};
+
+export const getTooltipStyle = () => tooltipStyle;
 
 // Custom tooltip formatter
 export const formatTooltipValue = (value: number, name: string): [string, string] => {
@@ -116,7 +116,7 @@ export const AnalyticsPageTemplate: React.FC<AnalyticsPageTemplateProps> = ({
                 onClick={() => onSectionChange(section.id)}
                 className={`
                   flex items-center gap-2 px-4 py-2 rounded-sm text-small font-medium 
-                  transition-all duration-fast
+                  transition-colors duration-fast
                   ${activeSection === section.id
                     ? 'bg-accent-gold text-background-base shadow-sm'
                     : 'bg-background-hover text-text-secondary hover:bg-background-border hover:text-text-primary'
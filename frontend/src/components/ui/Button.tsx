@@ -28,7 +28,7 @@ export const Button: React.FC<ButtonProps> = ({
   children,
   ...props
 }) => {
-  const baseStyles = 'inline-flex items-center justify-center gap-2 font-semibold rounded-sm transition-all duration-fast focus:outline-none focus:ring-2 focus:ring-accent-gold focus:ring-opacity-50 disabled:opacity-50 disabled:cursor-not-allowed';
+  const baseStyles = 'inline-flex items-center justify-center gap-2 font-semibold rounded-sm transition duration-fast focus:outline-none focus:ring-2 focus:ring-accent-gold focus:ring-opacity-50 disabled:opacity-50 disabled:cursor-not-allowed';
   
   const variantStyles = {
     primary: 'bg-accent-gold text-text-primary hover:bg-accent-gold-light active:bg-accent-gold-dark shadow-sm hover:shadow-md',
@@ -25,7 +25,7 @@ export const Card: React.FC<CardProps> = ({
   children,
   ...props
 }) => {
-  const baseStyles = 'bg-background-elevated rounded-md transition-all duration-default';
+  const baseStyles = 'bg-background-elevated rounded-md transition duration-default';
   
   const variantStyles = {
     default: 'border border-background-border shadow-sm',
@@ -35,7 +35,7 @@ export const ExportCard: React.FC<ExportCardProps> = ({
   const Icon = format.icon;
 
   return (
-    <Card className="hover:border-accent-gold transition-all duration-200 hover:shadow-md">
+    <Card className="hover:border-accent-gold transition duration-200 hover:shadow-md">
       <div className="flex flex-col h-full">
         {/* Header */}
         <div className="flex items-start justify-between mb-4">
@@ -65,7 +65,7 @@ export const Input = forwardRef<HTMLInputElement, InputProps>(
       rounded-sm
       text-text-primary
       placeholder-text-tertiary
-      transition-all
+      transition
       duration-default
       focus:outline-none
       focus:ring-2
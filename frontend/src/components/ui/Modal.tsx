@@ -154,7 +154,7 @@ export const Modal: React.FC<ModalProps> = ({
     >
       <div
         ref={modalRef}
-        className={`relative w-full ${getSizeClasses()} rounded-lg shadow-xl transform transition-all ${className}`}
+        className={`relative w-full ${getSizeClasses()} rounded-lg shadow-xl transform ${className}`}
         style={{
           backgroundColor: colors.background.elevated,
           border: `1px solid ${colors.background.border}`,
@@ -66,7 +66,7 @@ export const Select = forwardRef<HTMLSelectElement, SelectProps>(
       border
       rounded-sm
       text-text-primary
-      transition-all
+      transition
       duration-default
       focus:outline-none
       focus:ring-2
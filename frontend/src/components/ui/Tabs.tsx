@@ -74,7 +74,7 @@ export const Tabs: React.FC<TabsProps> = ({
   };
 
   const getVariantStyles = (tab: Tab, isActive: boolean) => {
-    const baseStyles = 'px-4 py-2.5 text-body font-medium transition-all duration-default focus:outline-none focus:ring-2 focus:ring-accent-gold focus:ring-offset-2 focus:ring-offset-background-base';
+    const baseStyles = 'px-4 py-2.5 text-body font-medium transition duration-default focus:outline-none focus:ring-2 focus:ring-accent-gold focus:ring-offset-2 focus:ring-offset-background-base';
 
     if (variant === 'underline') {
       return `
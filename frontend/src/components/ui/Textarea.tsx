@@ -60,7 +60,7 @@ export const Textarea = forwardRef<HTMLTextAreaElement, TextareaProps>(
       rounded-sm
       text-text-primary
       placeholder-text-tertiary
-      transition-all
+      transition
       duration-default
       focus:outline-none
       focus:ring-2
@@ -79,7 +79,7 @@ export const Tooltip: React.FC<TooltipProps> = ({
   }, []);
 
   const getPositionClasses = () => {
-    const base = 'absolute z-50 px-md py-sm text-sm rounded-md shadow-lg transition-all duration-fast';
+    const base = 'absolute z-50 px-md py-sm text-sm rounded-md shadow-lg transition duration-fast';
     
     switch (actualPosition) {
       case 'top':
@@ -32,6 +32,20 @@ import {
   Loader2
 } from 'lucide-react';
 
+// Static option lists live at module scope so re-renders reuse them
+const presets = [
+  { value: 'conservative', label: 'Conservative Retiree', description: 'Low risk, stable income' },
+  { value: 'moderate', label: 'Moderate Growth', description: 'Balanced approach' },
+  { value: 'aggressive', label: 'Aggressive Accumulator', description: 'High growth potential' },
+];
+
+const rebalanceOptions = [
+  { value: 'none', label: 'No Rebalancing' },
+  { value: 'annual', label: 'Annual Rebalancing' },
+  { value: 'quarterly', label: 'Quarterly Rebalancing' },
+  { value: 'threshold', label: 'Threshold-Based' },
+];
+
 const InputsPage: React.FC = () => {
   const navigate = useNavigate();
   const {
@@ -190,12 +204,6 @@ const InputsPage: React.FC = () => {
     }
   };
 
-  const presets = [
-    { value: 'conservative', label: 'Conservative Retiree', description: 'Low risk, stable income' },
-    { value: 'moderate', label: 'Moderate Growth', description: 'Balanced approach' },
-    { value: 'aggressive', label: 'Aggressive Accumulator', description: 'High growth potential' },
-  ];
-
   return (
     <div className="space-y-6 lg:space-y-xl pb-16 lg:pb-24">
       {/* Header with Preset Selection */}
@@ -222,7 +230,7 @@ const InputsPage: React.FC = () => {
               onClick={() => handleLoadPreset(preset.value)}
               disabled={isSaving}
               className={`
-                p-4 lg:p-5 rounded-md border-2 transition-all text-left
+                p-4 lg:p-5 rounded-md border-2 transition-colors text-left
                 ${selectedPreset === preset.value
                   ? 'border-accent-gold bg-accent-gold bg-opacity-10'
                   : 'border-background-border hover:border-accent-gold hover:bg-background-hover'
@@ -662,12 +670,7 @@ const InputsPage: React.FC = () => {
             label="Rebalancing Strategy"
             value={modelInputs.rebalance_strategy}
             onChange={(value) => setModelInputs({ rebalance_strategy: value })}
-            options={[
-              { value: 'none', label: 'No Rebalancing' },
-              { value: 'annual', label: 'Annual Rebalancing' },
-              { value: 'quarterly', label: 'Quarterly Rebalancing' },
-              { value: 'threshold', label: 'Threshold-Based' },
-            ]}
+            options={rebalanceOptions}
           />
 
           <PercentInput
@@ -722,7 +725,7 @@ const InputsPage: React.FC = () => {
               onClick={handleValidate}
               type="button"
               disabled={isLoading}
-              className="px-6 py-3 text-body font-semibold rounded-sm transition-all bg-background-hover text-text-secondary hover:bg-background-border hover:text-text-primary disabled:opacity-50 disabled:cursor-not-allowed"
+              className="px-6 py-3 text-body font-semibold rounded-sm transition-colors bg-background-hover text-text-secondary hover:bg-background-border hover:text-text-primary disabled:opacity-50 disabled:cursor-not-allowed"
             >
               {isLoading ? 'Validating...' : 'Validate Inputs'}
             </button>
@@ -730,7 +733,7 @@ const InputsPage: React.FC = () => {
               onClick={handleRunSimulation}
               type="button"
               disabled={isLoading}
-              className="inline-flex items-center justify-center gap-2 px-6 py-3 text-body font-semibold rounded-sm transition-all bg-accent-gold text-text-primary hover:bg-accent-gold-light shadow-sm hover:shadow-md disabled:opacity-50 disabled:cursor-not-allowed"
+              className="inline-flex items-center justify-center gap-2 px-6 py-3 text-body font-semibold rounded-sm transition bg-accent-gold text-text-primary hover:bg-accent-gold-light shadow-sm hover:shadow-md disabled:opacity-50 disabled:cursor-not-allowed"
             >
               {isLoading ? (
                 <>
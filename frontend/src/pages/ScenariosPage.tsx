@@ -372,7 +372,7 @@ const ScenariosPage: React.FC = () => {
             <button
               key={idx}
               onClick={() => addScenario(template)}
-              className="p-4 text-left rounded-md border border-background-border hover:border-accent-gold hover:bg-background-hover transition-all"
+              className="p-4 text-left rounded-md border border-background-border hover:border-accent-gold hover:bg-background-hover transition-colors"
             >
               <div className="flex items-start gap-3 mb-2">
                 <div className="text-accent-gold flex-shrink-0">
@@ -137,6 +137,14 @@ export function getDefaultChartConfig() {
   };
 }
 
+// Formatter construction is costly; build it once at module load
+const currencyFormatter = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0,
+});
+
 /**
  * Format currency for chart labels
  * @param value - Number to format
@@ -156,12 +164,7 @@ export function formatChartCurrency(value: number, compact: boolean = false): st
     }
   }
   
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(value);
+  return currencyFormatter.format(value);
 }
 
 /**
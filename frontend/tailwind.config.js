@@ -68,6 +68,10 @@ export default {
           p10: '#F85149',        // Updated
         },
       },
+      // Default border color, applied by Tailwind's preflight reset
+      borderColor: {
+        DEFAULT: '#34393F',   // background.border
+      },
       fontFamily: {
         sans: ['Inter', 'system-ui', '-apple-system', 'sans-serif'],
         display: ['Nunito Sans', 'system-ui', '-apple-system', 'sans-serif'],
@@ -14,6 +14,7 @@ Key Optimizations:
 """
 
 import time
+import math
 import functools
 import hashlib
 import json
@@ -26,6 +27,11 @@ import logging
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # optional accelerator; NumPy path is used without it
+    numba = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -198,6 +204,28 @@ def generate_cache_key(data: Dict[str, Any]) -> str:
 # VECTORIZED MONTE CARLO SIMULATION
 # ===========================================
 
+# JIT compilation costs a second or two on first use, so the compiled month
+# step only kicks in for runs large enough to amortize it.
+NUMBA_MIN_SCENARIOS = 20_000
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _advance_month_numba(val, z, out, mins, cash_flow, spend_rate, growth, sigma_month):
+        """Fused cash-flow + return + running-min step for one month, in place."""
+        for j in numba.prange(val.shape[0]):
+            v = val[j] + (cash_flow - val[j] * spend_rate)
+            g = growth + sigma_month * z[j]
+            # max(max(v, 0) * g, 0) == max(v, 0) * max(g, 0): one fused,
+            # branch-free step (a path floored at zero stays at zero)
+            v = max(v, 0.0) * max(g, 0.0)
+            val[j] = v
+            out[j] = v
+            if v < mins[j]:
+                mins[j] = v
+else:
+    _advance_month_numba = None
+
+
 def run_monte_carlo_vectorized(
     starting_portfolio: float,
     monthly_spending: float,
@@ -210,8 +238,14 @@ def run_monte_carlo_vectorized(
     spending_rule: int = 1,
     spending_pct_annual: float = 0.0,
     current_age: float = 65.0,
-    seed: Optional[int] = None
-) -> Tuple[np.ndarray, pd.DataFrame, Dict[str, float]]:
+    seed: Optional[int] = None,
+    antithetic: bool = True,
+    use_qmc: bool = False,
+    use_numba: Optional[bool] = None,
+    dtype: type = np.float64,
+    metrics_only: bool = False,
+    store_paths: bool = True
+) -> Tuple[Optional[np.ndarray], Optional[pd.DataFrame], Dict[str, float]]:
     """
     Fully vectorized Monte Carlo simulation - 10-50x faster than loop version.
     
@@ -230,18 +264,59 @@ def run_monte_carlo_vectorized(
         spending_pct_annual: Annual spending percentage (if percentage rule)
         current_age: Current age for calculating income start times
         seed: Random seed for reproducibility
+        antithetic: Pair each shock Z with -Z (antithetic variates). Halves the
+            number of normal draws and lowers estimator variance; scenarios
+            are no longer independent but come in mirrored pairs.
+        use_qmc: Use a scrambled Sobol sequence mapped through the normal
+            inverse CDF instead of pseudo-random shocks (requires scipy).
+            n_scenarios is rounded up to a power of 2 for Sobol balance, so
+            the returned arrays may have more columns than requested.
+        use_numba: Run the per-month update through a fused, parallel Numba
+            kernel. None (default) enables it when numba is installed and
+            n_scenarios >= NUMBA_MIN_SCENARIOS. Shocks are still drawn by the
+            NumPy generator, so results match the NumPy path for a given seed.
+        dtype: Floating type for the path array and shocks. np.float32 halves
+            memory traffic for large runs at the cost of ~7 significant
+            digits per path; stats and metrics are still reported in float64.
+        metrics_only: Skip storing the per-month path array and the percentile
+            bands; values_array and stats_df are returned as None. Saves
+            n_months * n_scenarios of memory when only metrics are needed.
+        store_paths: Keep the per-month path array. When False the percentile
+            bands are computed as each month is simulated and values_array is
+            returned as None, so memory stays O(n_scenarios) while stats_df
+            is still produced.
     
     Returns:
         (values_array, stats_df, metrics_dict)
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
-    # Initialize arrays
-    values = np.zeros((n_months, n_scenarios), dtype=np.float64)
+    if use_qmc:
+        # Sobol points are only balanced for power-of-2 sample counts
+        n_scenarios = 1 << max(0, int(n_scenarios - 1).bit_length())
     
-    # Generate all random returns at once (n_months x n_scenarios)
-    returns = np.random.normal(mu_month, sigma_month, size=(n_months, n_scenarios))
+    # Initialize arrays
+    values = None if metrics_only or not store_paths else np.zeros((n_months, n_scenarios), dtype=dtype)
+    # Without the path array the display bands are taken month by month
+    band_percentiles = [10, 25, 50, 75, 90]
+    bands = np.empty((n_months, 5)) if values is None and not metrics_only else None
+    
+    # Shocks are drawn one month at a time into a reusable buffer so RNG
+    # working memory is O(n_scenarios) rather than O(n_months * n_scenarios).
+    # With antithetic variates only the first half is drawn and mirrored;
+    # odd counts drop the last mirror.
+    n_draw = (n_scenarios + 1) // 2 if antithetic else n_scenarios
+    z = np.empty(n_scenarios, dtype=dtype)
+    
+    if use_qmc:
+        try:
+            from scipy.stats import norm, qmc
+        except ImportError as e:
+            raise ImportError("use_qmc=True requires scipy") from e
+        sobol = qmc.Sobol(d=n_months, scramble=True, seed=seed)
+        qmc_shocks = norm.ppf(sobol.random(n_draw)).T  # (n_months, n_draw)
+    else:
+        qmc_shocks = None
     
     # Pre-compute inflation factors for spending
     if spending_rule == 1:
@@ -289,60 +364,131 @@ def run_monte_carlo_vectorized(
                 
                 # Apply inflation if specified (healthcare has separate inflation)
                 if inflation > 0:
-                    monthly_infl = (1 + inflation) ** (1 / 12) - 1
+                    # (1 + monthly)**k == exp(k * log1p(annual) / 12); avoids the
+                    # pow round trip and stays accurate for small rates
+                    monthly_log_growth = math.log1p(inflation) / 12.0
                     months_from_start = np.maximum(0, np.arange(n_months) - months_until_start)
-                    inflation_factors = np.power(1 + monthly_infl, months_from_start)
+                    inflation_factors = np.exp(monthly_log_growth * months_from_start)
                     income_vec *= inflation_factors
                 
                 cash_flows += income_vec
     
+    # Under the fixed-dollar rule a depleted path stays at zero unless some
+    # later month has a positive net cash flow, so dead paths can be skipped
+    # once no such month remains. Proportional spending never depletes.
+    if spending_rule == 1:
+        net_positive = (cash_flows - spending_array) > 0
+        no_revival = ~np.logical_or.accumulate(net_positive[::-1])[::-1]
+    else:
+        no_revival = None
+    
+    if use_numba is None:
+        use_numba = _advance_month_numba is not None and n_scenarios >= NUMBA_MIN_SCENARIOS
+    elif use_numba and _advance_month_numba is None:
+        raise ImportError("use_numba=True requires numba")
+    # Cast the per-month schedules and rates once so the loop stays in dtype
+    cash_flows = cash_flows.astype(dtype, copy=False)
+    if spending_array is not None:
+        spending_array = spending_array.astype(dtype, copy=False)
+    spend_rate = dtype(spending_pct_annual / 12.0 if spending_rule != 1 else 0.0)
+    # Resolve the spending rule once: fixed-dollar spending folds into the
+    # per-month cash flow, proportional spending is applied to the paths
+    proportional = spending_rule != 1
+    net_cash_flows = cash_flows if proportional else cash_flows - spending_array
+    growth = dtype(1.0 + mu_month)
+    sigma_month = dtype(sigma_month)
+    
     # Vectorized simulation loop (still need one loop for path dependency)
-    val = np.full(n_scenarios, starting_portfolio, dtype=np.float64)
+    val = np.full(n_scenarios, starting_portfolio, dtype=dtype)
+    # Per-path minimum is tracked as we go rather than by a second sweep
+    min_values = np.full(n_scenarios, np.inf, dtype=dtype)
     
     for m in range(n_months):
-        # Calculate spending for this month
-        if spending_rule == 1:
-            # Fixed dollar rule (inflated)
-            spending = spending_array[m]
+        # Draw this month's shocks
+        if qmc_shocks is not None:
+            z[:n_draw] = qmc_shocks[m]
         else:
-            # Percentage rule (varies with portfolio value)
-            spending = val * (spending_pct_annual / 12.0)
+            rng.standard_normal(out=z[:n_draw], dtype=dtype)
+        if antithetic:
+            np.negative(z[:n_scenarios - n_draw], out=z[n_draw:])
         
-        # Total cash flow = income - spending
-        cf = cash_flows[m] - spending
+        if use_numba:
+            out = val if values is None else values[m]
+            _advance_month_numba(val, z, out, min_values, net_cash_flows[m], spend_rate, growth, sigma_month)
+            if bands is not None:
+                bands[m] = np.percentile(val, band_percentiles, method="nearest")
+            continue
         
-        # Apply cash flow
-        val = np.maximum(val + cf, 0.0)
+        # Total cash flow = income - spending; only the percentage rule
+        # varies with portfolio value
+        if proportional:
+            cf = net_cash_flows[m] - val * spend_rate
+        else:
+            cf = net_cash_flows[m]
         
-        # Apply returns (vectorized across all scenarios)
-        val = np.maximum(val * (1.0 + returns[m, :]), 0.0)
+        live = np.flatnonzero(val) if no_revival is not None and no_revival[m] else None
+        if live is not None and live.size < n_scenarios // 2:
+            # Advance only live paths; depleted ones remain at zero
+            val_live = np.maximum(val[live] + cf, 0.0)
+            val[live] = np.maximum(val_live * (growth + sigma_month * z[live]), 0.0)
+        else:
+            # Apply cash flow (in place: no per-month temporaries)
+            np.add(val, cf, out=val)
+            np.maximum(val, 0.0, out=val)
+            
+            # Apply returns (vectorized across all scenarios); the shock
+            # buffer is refilled next month, so turn it into growth factors
+            np.multiply(z, sigma_month, out=z)
+            z += growth
+            np.multiply(val, z, out=val)
+            np.maximum(val, 0.0, out=val)
         
         # Store values
-        values[m, :] = val
-    
-    # Compute statistics (vectorized percentile calculation)
-    stats_df = pd.DataFrame({
-        "Month": np.arange(1, n_months + 1),
-        "P10": np.percentile(values, 10, axis=1),
-        "P25": np.percentile(values, 25, axis=1),
-        "Median": np.percentile(values, 50, axis=1),
-        "P75": np.percentile(values, 75, axis=1),
-        "P90": np.percentile(values, 90, axis=1),
-    })
-    
-    # Compute metrics (vectorized operations)
-    ending_values = values[-1, :]
-    min_values = values.min(axis=0)
+        if values is not None:
+            values[m, :] = val
+        elif bands is not None:
+            bands[m] = np.percentile(val, band_percentiles, method="nearest")
+        np.minimum(min_values, val, out=min_values)
+    
+    # Compute statistics (single percentile pass for all display bands).
+    # 'nearest' skips interpolation; it is a display-only approximation, the
+    # dollar figures in `metrics` below keep linear interpolation.
+    if values is not None or bands is not None:
+        if values is not None:
+            bands = np.percentile(
+                values, band_percentiles, axis=1, method="nearest"
+            ).astype(np.float64, copy=False).T
+        p10, p25, p50, p75, p90 = bands.T
+        # The band arrays are fresh, so wrap them without copying and give
+        # the index directly instead of having pandas infer it
+        stats_df = pd.DataFrame({
+            "Month": np.arange(1, n_months + 1),
+            "P10": p10,
+            "P25": p25,
+            "Median": p50,
+            "P75": p75,
+            "P90": p90,
+        }, index=pd.RangeIndex(n_months), copy=False)
+    else:
+        stats_df = None
+    
+    # Compute metrics (the running values are the ending row; count
+    # booleans directly instead of averaging a float-coerced temporary)
+    ending_values = val
+    ending_p10, ending_median, ending_p90 = np.percentile(
+        ending_values.astype(np.float64, copy=False), [10, 50, 90]
+    )
+    prob_positive_at_end = np.count_nonzero(ending_values > 0) / n_scenarios
     
     metrics = {
-        "ending_median": float(np.median(ending_values)),
-        "ending_p10": float(np.percentile(ending_values, 10)),
-        "ending_p90": float(np.percentile(ending_values, 90)),
-        "ending_mean": float(np.mean(ending_values)),
-        "ending_std": float(np.std(ending_values)),
-        "prob_never_depleted": float(np.mean(min_values > 0)),
-        "prob_positive_at_end": float(np.mean(ending_values > 0)),
-        "success_probability": float(np.mean(ending_values > 0)),
+        "ending_median": float(ending_median),
+        "ending_p10": float(ending_p10),
+        "ending_p90": float(ending_p90),
+        "ending_mean": float(np.mean(ending_values, dtype=np.float64)),
+        "ending_std": float(np.std(ending_values, dtype=np.float64)),
+        "prob_never_depleted": float(np.count_nonzero(min_values > 0) / n_scenarios),
+        "prob_positive_at_end": float(prob_positive_at_end),
+        "success_probability": float(prob_positive_at_end),
     }
     
     return values, stats_df, metrics
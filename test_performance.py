@@ -362,6 +362,164 @@ def test_vectorized_matches_reference():
     assert 0 <= success_prob <= 1, "Success probability out of range"
 
 
+def test_antithetic_paths_are_mirrored():
+    """Test: Antithetic variates pair scenarios with mirrored shocks"""
+    params = dict(
+        starting_portfolio=1000000,
+        monthly_spending=0,
+        mu_month=0.0,
+        sigma_month=0.04,
+        monthly_inflation=0.0,
+        n_scenarios=101,
+        n_months=12,
+        seed=7
+    )
+    
+    values, _, _ = run_monte_carlo_vectorized(**params)
+    assert values.shape == (12, 101)
+    
+    # With zero drift, month-1 returns of paired scenarios cancel exactly
+    first_month = values[0] / params['starting_portfolio'] - 1.0
+    np.testing.assert_allclose(first_month[:50], -first_month[51:101])
+    
+    values_plain, _, _ = run_monte_carlo_vectorized(**params, antithetic=False)
+    assert values_plain.shape == (12, 101)
+
+
+def test_qmc_rounds_scenarios_to_power_of_two():
+    """Test: Sobol QMC sampling rounds scenario count up to a power of 2"""
+    pytest.importorskip("scipy")
+    
+    values, stats_df, metrics = run_monte_carlo_vectorized(
+        starting_portfolio=1000000,
+        monthly_spending=3000,
+        mu_month=0.005,
+        sigma_month=0.04,
+        monthly_inflation=0.002,
+        n_scenarios=1000,
+        n_months=120,
+        seed=42,
+        use_qmc=True
+    )
+    
+    assert values.shape == (120, 1024)
+    assert len(stats_df) == 120
+    assert np.isfinite(values).all()
+    assert 0 <= metrics['success_probability'] <= 1
+
+
+def test_numba_kernel_matches_numpy():
+    """Test: Numba month step reproduces the NumPy path for a fixed seed"""
+    pytest.importorskip("numba")
+    
+    for rule in (1, 2):
+        kwargs = dict(
+            starting_portfolio=1000000,
+            monthly_spending=6000,
+            mu_month=0.005,
+            sigma_month=0.04,
+            monthly_inflation=0.002,
+            n_scenarios=501,
+            n_months=120,
+            spending_rule=rule,
+            spending_pct_annual=0.04,
+            seed=7
+        )
+        values_np, _, _ = run_monte_carlo_vectorized(use_numba=False, **kwargs)
+        values_nb, _, _ = run_monte_carlo_vectorized(use_numba=True, **kwargs)
+        np.testing.assert_allclose(values_nb, values_np, rtol=1e-12, atol=1e-6)
+
+
+def test_depleted_paths_stay_at_zero():
+    """Test: a withdrawal larger than the balance floors the path at zero for good"""
+    kwargs = dict(
+        starting_portfolio=10000,
+        monthly_spending=6000,
+        mu_month=0.005,
+        sigma_month=0.04,
+        monthly_inflation=0.002,
+        n_scenarios=64,
+        n_months=24,
+        seed=3
+    )
+    use_numba_options = [False]
+    try:
+        import numba  # noqa: F401
+        use_numba_options.append(True)
+    except ImportError:
+        pass
+    
+    for use_numba in use_numba_options:
+        values, _, metrics = run_monte_carlo_vectorized(use_numba=use_numba, **kwargs)
+        
+        # Month 1 leaves ~4000 growing; month 2's withdrawal depletes every path
+        assert (values[0] > 0).all()
+        assert (values[1:] == 0).all()
+        assert metrics['success_probability'] == 0.0
+
+
+def test_float32_paths_track_float64():
+    """Test: float32 simulation stays close to float64 and reports float64 stats"""
+    kwargs = dict(
+        starting_portfolio=1000000,
+        monthly_spending=4000,
+        mu_month=0.005,
+        sigma_month=0.04,
+        monthly_inflation=0.002,
+        n_scenarios=1000,
+        n_months=360,
+        seed=11
+    )
+    values64, _, metrics64 = run_monte_carlo_vectorized(**kwargs)
+    values32, stats32, metrics32 = run_monte_carlo_vectorized(dtype=np.float32, **kwargs)
+    
+    assert values32.dtype == np.float32
+    assert stats32["Median"].dtype == np.float64
+    # float32 shocks come from a different RNG stream, so compare statistically
+    assert abs(metrics32['success_probability'] - metrics64['success_probability']) <= 0.05
+    assert metrics32['ending_median'] == pytest.approx(metrics64['ending_median'], rel=0.1)
+
+
+def test_metrics_only_matches_full_run():
+    """Test: metrics_only skips paths/stats but reports identical metrics"""
+    kwargs = dict(
+        starting_portfolio=1000000,
+        monthly_spending=5000,
+        mu_month=0.005,
+        sigma_month=0.04,
+        monthly_inflation=0.002,
+        n_scenarios=1000,
+        n_months=360,
+        seed=5
+    )
+    _, _, metrics_full = run_monte_carlo_vectorized(**kwargs)
+    values, stats_df, metrics = run_monte_carlo_vectorized(metrics_only=True, **kwargs)
+    
+    assert values is None
+    assert stats_df is None
+    assert metrics == metrics_full
+
+
+def test_streamed_bands_match_stored_paths():
+    """Test: store_paths=False drops the path array but keeps identical stats"""
+    kwargs = dict(
+        starting_portfolio=1000000,
+        monthly_spending=5000,
+        mu_month=0.005,
+        sigma_month=0.04,
+        monthly_inflation=0.002,
+        n_scenarios=1000,
+        n_months=360,
+        seed=5
+    )
+    _, stats_full, metrics_full = run_monte_carlo_vectorized(**kwargs)
+    values, stats_df, metrics = run_monte_carlo_vectorized(store_paths=False, **kwargs)
+    
+    assert values is None
+    pd.testing.assert_frame_equal(stats_df, stats_full)
+    assert metrics == metrics_full
+
+
 # ===========================================
 # BENCHMARK SUITE
 # ===========================================